@@ -0,0 +1,95 @@
+"""
+Preallocated PCM buffer for assembling audio chunks.
+"""
+
+from pydub import AudioSegment
+
+class AudioArena:
+    """
+    Preallocated PCM buffer for assembling many audio chunks into one AudioSegment.
+    
+    Chunks are copied once into a contiguous bytearray at the current write
+    offset, instead of re-copying the running total on every AudioSegment +.
+    Like AudioSegment +, the result takes the highest frame rate, sample width
+    and channel count of anything appended.
+    """
+    
+    # Extra capacity reserved beyond the estimate so small overshoots don't reallocate
+    GHOST_RATIO = 0.1
+    
+    def __init__(self, frame_rate: int, sample_width: int, channels: int, estimated_ms: int = 0):
+        """Create an arena sized for roughly estimated_ms of audio in the given format."""
+        self.frame_rate = frame_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.estimated_ms = estimated_ms
+        self.offset = 0
+        self.buffer = bytearray(0)
+        self.reserve(estimated_ms)
+        
+    @property
+    def bytes_per_ms(self) -> float:
+        """Number of PCM bytes per millisecond of audio."""
+        return self.frame_rate * self.sample_width * self.channels / 1000
+        
+    def reserve(self, duration_ms: int) -> None:
+        """Ensure capacity for duration_ms of audio (plus the ghost region) in total."""
+        capacity = int(duration_ms * self.bytes_per_ms * (1 + self.GHOST_RATIO))
+        if capacity > len(self.buffer):
+            self.buffer.extend(bytes(capacity - len(self.buffer)))
+            
+    def append(self, data: bytes) -> None:
+        """Copy raw PCM bytes (already in the arena's format) to the write offset."""
+        end = self.offset + len(data)
+        if end > len(self.buffer):
+            # Grow geometrically so repeated overflows stay amortized O(N)
+            self.buffer.extend(bytes(max(end - len(self.buffer), len(self.buffer) // 2)))
+        self.buffer[self.offset:end] = data
+        self.offset = end
+        
+    def append_segment(self, audio: AudioSegment) -> None:
+        """Append an AudioSegment, converting it (or the arena) to the wider format if needed."""
+        fmt = (max(self.frame_rate, audio.frame_rate),
+               max(self.sample_width, audio.sample_width),
+               max(self.channels, audio.channels))
+        if fmt != (self.frame_rate, self.sample_width, self.channels):
+            self._convert(*fmt)
+            
+        if audio.frame_rate != self.frame_rate:
+            audio = audio.set_frame_rate(self.frame_rate)
+        if audio.channels != self.channels:
+            audio = audio.set_channels(self.channels)
+        if audio.sample_width != self.sample_width:
+            audio = audio.set_sample_width(self.sample_width)
+        self.append(audio.raw_data)
+        
+    def _convert(self, frame_rate: int, sample_width: int, channels: int) -> None:
+        """Re-encode the audio written so far into a wider format and continue in it."""
+        written = self.to_audiosegment()
+        self.frame_rate = frame_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.reserve(max(self.estimated_ms, len(written)))
+        self.append_segment(written)
+        
+    def __len__(self) -> int:
+        """Duration of the assembled audio in milliseconds."""
+        return int(self.offset / self.bytes_per_ms)
+        
+    def to_audiosegment(self) -> AudioSegment:
+        """
+        Build the combined AudioSegment from the written part of the buffer.
+        
+        The buffer is trimmed and handed to the segment without copying, so the
+        arena is left empty afterwards.
+        """
+        data = self.buffer
+        del data[self.offset:]
+        self.buffer = bytearray()
+        self.offset = 0
+        return AudioSegment(
+            data=data,
+            sample_width=self.sample_width,
+            frame_rate=self.frame_rate,
+            channels=self.channels
+        )
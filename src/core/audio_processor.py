@@ -4,13 +4,14 @@ Audio processor module for handling audio file processing and manipulation.
 
 import os
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 import numpy as np
 import soundfile as sf
 from pydub import AudioSegment
 from pydub.effects import normalize, compress_dynamic_range
 import shutil
+from .audio_arena import AudioArena
 
 class AudioProcessor:
     """Handles audio file processing and manipulation."""
@@ -117,20 +118,54 @@ class AudioProcessor:
             # Create output directory if it doesn't exist
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            # Combine audio segments
-            combined = AudioSegment.empty()
+            # Combine audio segments into one preallocated buffer, sized from the
+            # first file on the assumption that chapters are of similar length
+            arena = None
             for file_path in input_files:
                 audio = AudioSegment.from_file(file_path)
-                combined += audio
+                if arena is None:
+                    arena = AudioArena(audio.frame_rate, audio.sample_width, audio.channels,
+                                       estimated_ms=len(audio) * len(input_files))
+                arena.append_segment(audio)
                 
             # Export combined audio
-            combined.export(output_file, format='mp3')
+            arena.to_audiosegment().export(output_file, format='mp3')
             return True
             
         except Exception as e:
             self.logger.error(f"Error combining audio files: {e}")
             return False
             
+    def generate_speed_variants_array(self, samples: np.ndarray, sample_rate: int,
+                                      speeds: Iterable[float] = (0.8, 1.0, 1.2)) -> Dict[float, np.ndarray]:
+        """
+        Time-stretch mono float samples to each playback speed without changing pitch.
+        
+        Works entirely in memory with librosa's phase vocoder, so no files are
+        written and ffmpeg is never invoked.
+        
+        Args:
+            samples: Mono float32 samples
+            sample_rate: Sample rate of the samples in Hz
+            speeds: Playback speeds; values above 1.0 shorten the audio
+            
+        Returns:
+            Dictionary mapping each speed to its stretched samples
+        """
+        import librosa
+        
+        variants = {}
+        for speed in speeds:
+            if speed <= 0:
+                raise ValueError(f"Speed must be positive, got {speed}")
+            if speed == 1.0:
+                variants[speed] = samples
+            else:
+                variants[speed] = librosa.effects.time_stretch(samples, rate=speed)
+                
+        self.logger.debug("Generated %d speed variants at %d Hz", len(variants), sample_rate)
+        return variants
+        
     def _normalize_audio(self, audio: AudioSegment, target_lufs: float) -> AudioSegment:
         """Normalize audio to target LUFS level."""
         try:
@@ -31,26 +31,26 @@ class BookmarkManager:
             Bookmark data dictionary
         """
         try:
-            bookmark_data = {
+            # Build all chapter rows in one pass
+            chapters = [
+                {
+                    'index': i,
+                    'title': chapter['title'],
+                    'start_time': times['start'],
+                    'duration': times['end'] - times['start']
+                }
+                for i, (chapter, times) in enumerate(zip(chapter_info, chapter_times))
+            ]
+            
+            return {
                 'audiobook_id': audiobook_id,
                 'created_at': datetime.now().isoformat(),
                 'last_position': 0,
                 'last_chapter': 0,
                 'play_history': [],
-                'chapters': []
+                'chapters': chapters
             }
             
-            # Add chapter information
-            for i, (chapter, times) in enumerate(zip(chapter_info, chapter_times)):
-                bookmark_data['chapters'].append({
-                    'index': i,
-                    'title': chapter['title'],
-                    'start_time': times['start'],
-                    'duration': times['end'] - times['start']
-                })
-                
-            return bookmark_data
-            
         except Exception as e:
             self.logger.error(f"Error creating bookmark data: {e}")
             raise
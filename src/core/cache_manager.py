@@ -8,18 +8,29 @@ import hashlib
 import logging
 import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime, timedelta
 
+class FileStorageBackend:
+    """Looks up cached audio files on the local filesystem."""
+    
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+        
+    def remove(self, path: str) -> None:
+        os.remove(path)
+        
 class TTSCache:
     """Cache for TTS API calls to avoid regenerating the same content."""
     
     def __init__(self, cache_dir: str = "tts_cache", 
                  db_path: str = "tts_cache.db",
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 storage_backend: Optional[FileStorageBackend] = None):
         self.cache_dir = Path(cache_dir)
         self.db_path = db_path
         self.logger = logger or logging.getLogger(__name__)
+        self.storage = storage_backend or FileStorageBackend()
         
         # Create cache directory
         self.cache_dir.mkdir(exist_ok=True)
@@ -27,12 +38,26 @@ class TTSCache:
         # Initialize database
         self._init_db()
         
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database; "file:" paths are opened as SQLite URIs."""
+        conn = sqlite3.connect(self.db_path, uri=self.db_path.startswith("file:"))
+        
+        # These settings last only as long as the connection, so every connection sets them.
+        # In WAL mode, synchronous=NORMAL makes a commit a log append instead of an fsync
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+        
     def _init_db(self) -> None:
         """Initialize cache database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                # WAL is stored in the database file, so setting it once covers later connections
+                cursor.execute("PRAGMA journal_mode=WAL")
+                
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS cache (
                         content_hash TEXT PRIMARY KEY,
@@ -78,7 +103,7 @@ class TTSCache:
         try:
             content_hash = self._get_content_hash(text, voice_settings)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -90,7 +115,7 @@ class TTSCache:
                 row = cursor.fetchone()
                 if row:
                     audio_file = row[0]
-                    if os.path.exists(audio_file):
+                    if self.storage.exists(audio_file):
                         # Update access statistics
                         cursor.execute("""
                             UPDATE cache
@@ -133,7 +158,7 @@ class TTSCache:
             content_hash = self._get_content_hash(text, voice_settings)
             now = datetime.now().timestamp()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -159,6 +184,54 @@ class TTSCache:
             self.logger.error(f"Error caching audio: {e}")
             return False
             
+    def cache_audio_many(self, entries: Iterable[Tuple[str, Dict[str, Any], str]]) -> bool:
+        """
+        Cache several audio files in a single transaction.
+        
+        Args:
+            entries: (text, voice_settings, audio_file) tuples
+            
+        Returns:
+            True if successful
+        """
+        try:
+            now = datetime.now().timestamp()
+            rows = [
+                (
+                    self._get_content_hash(text, voice_settings),
+                    audio_file,
+                    json.dumps(voice_settings),
+                    now,
+                    now,
+                    1
+                )
+                for text, voice_settings, audio_file in entries
+            ]
+            
+            with self._connect() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO cache (
+                        content_hash, audio_file, voice_settings,
+                        created_at, last_accessed, access_count
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+                
+            self.logger.info(f"Cached audio for {len(rows)} content hashes")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error caching audio: {e}")
+            return False
+            
+    def clear(self) -> None:
+        """Remove every cache entry in one transaction; audio files are left on disk."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM cache")
+                
+        except Exception as e:
+            self.logger.error(f"Error clearing cache: {e}")
+            
     def cleanup(self, max_age_days: int = 30, min_access_count: int = 1) -> None:
         """
         Clean up old and unused cache entries.
@@ -170,7 +243,7 @@ class TTSCache:
         try:
             cutoff_time = (datetime.now() - timedelta(days=max_age_days)).timestamp()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get entries to remove
@@ -185,8 +258,8 @@ class TTSCache:
                     
                     # Remove audio file
                     try:
-                        if os.path.exists(audio_file):
-                            os.remove(audio_file)
+                        if self.storage.exists(audio_file):
+                            self.storage.remove(audio_file)
                     except Exception as e:
                         self.logger.warning(f"Could not remove audio file {audio_file}: {e}")
                         
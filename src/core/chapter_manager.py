@@ -2,18 +2,43 @@
 Chapter management module for handling chapter detection and organization.
 """
 
+import functools
 import logging
 import re
 from typing import Optional, List, Tuple, Dict
 import spacy
 from spacy.lang.en import English
 
+# Common chapter patterns - expanded to catch more formats
+_CHAPTER_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r'Chapter\s+\d+[.:]\s*([^\n]+)',       # Chapter 1: Title
+    r'CHAPTER\s+\d+[.:]\s*([^\n]+)',       # CHAPTER 1: Title (all caps)
+    r'^\s*\d+\.\s*([^\n]+)',               # 1. Title (with possible indent)
+    r'^\s*[IVX]+\.\s*([^\n]+)',            # I. Title (with possible indent)
+    r'^\s*[A-Z]\.\s*([^\n]+)',             # A. Title (with possible indent)
+    r'^\s*PART\s+\d+[.:]\s*([^\n]+)',      # PART 1: Title
+    r'^\s*Part\s+\d+[.:]\s*([^\n]+)',      # Part 1: Title
+    r'^\s*SECTION\s+\d+[.:]\s*([^\n]+)',   # SECTION 1: Title
+    r'^\s*Section\s+\d+[.:]\s*([^\n]+)',   # Section 1: Title
+    r'^\s*\d+\s+([A-Z][^\n]+)',            # 1 TITLE (number followed by all caps title)
+    r'^\s*[A-Z][A-Z\s]+$'                  # ALL CAPS LINE (likely a chapter title)
+))
+
+# Sentence-level heading cues used when scoring semantic chapter breaks
+_HEADING_WORD_RE = re.compile(r'chapter|part|section|volume|book')
+_NUMBERED_HEADING_RE = re.compile(r'^\s*(\d+|[ivxlcdm]+|[IVXLCDM]+)\.?\s+\w+')
+
+@functools.lru_cache(maxsize=1)
+def _load_nlp() -> spacy.language.Language:
+    """Load the spaCy pipeline once per process; every ChapterManager shares it read-only."""
+    return spacy.load("en_core_web_sm")
+
 class ChapterManager:
     """Handles chapter detection and organization."""
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
-        self.nlp = spacy.load("en_core_web_sm")
+        self.nlp = _load_nlp()
         
     def detect_chapters(self, text: str, max_chapters: int = 30) -> List[Tuple[str, str]]:
         """
@@ -78,30 +103,15 @@ class ChapterManager:
     def _find_explicit_chapters(self, text: str) -> List[Tuple[str, str]]:
         """Find chapters marked with explicit markers."""
         try:
-            # Common chapter patterns - expanded to catch more formats
-            patterns = [
-                r'Chapter\s+\d+[.:]\s*([^\n]+)',       # Chapter 1: Title
-                r'CHAPTER\s+\d+[.:]\s*([^\n]+)',       # CHAPTER 1: Title (all caps)
-                r'^\s*\d+\.\s*([^\n]+)',               # 1. Title (with possible indent)
-                r'^\s*[IVX]+\.\s*([^\n]+)',            # I. Title (with possible indent)
-                r'^\s*[A-Z]\.\s*([^\n]+)',             # A. Title (with possible indent)
-                r'^\s*PART\s+\d+[.:]\s*([^\n]+)',      # PART 1: Title
-                r'^\s*Part\s+\d+[.:]\s*([^\n]+)',      # Part 1: Title
-                r'^\s*SECTION\s+\d+[.:]\s*([^\n]+)',   # SECTION 1: Title
-                r'^\s*Section\s+\d+[.:]\s*([^\n]+)',   # Section 1: Title
-                r'^\s*\d+\s+([A-Z][^\n]+)',            # 1 TITLE (number followed by all caps title)
-                r'^\s*[A-Z][A-Z\s]+$'                  # ALL CAPS LINE (likely a chapter title)
-            ]
-            
             self.logger.info(f"Searching for explicit chapter patterns in text of length {len(text)}")
             
             # Get all potential chapter markers and sort by position
             all_matches = []
             
-            for pattern_idx, pattern in enumerate(patterns):
-                for match in re.finditer(pattern, text, re.MULTILINE):
+            for pattern_idx, pattern in enumerate(_CHAPTER_PATTERNS):
+                for match in pattern.finditer(text):
                     # For the last pattern (ALL CAPS), use the whole match as title
-                    if pattern_idx == len(patterns) - 1:
+                    if pattern_idx == len(_CHAPTER_PATTERNS) - 1:
                         title = match.group(0).strip()
                     else:
                         # For other patterns, use the captured group
@@ -114,7 +124,7 @@ class ChapterManager:
                         'title': title,
                         'start': match.start(),
                         'end': match.end(),
-                        'pattern': pattern
+                        'pattern': pattern.pattern
                     })
             
             # Sort matches by position in text
@@ -214,11 +224,11 @@ class ChapterManager:
                     score *= 3.0
                     
                 # Large bonus for chapter-like phrases
-                if re.search(r'chapter|part|section|volume|book', sent.text.lower()):
+                if _HEADING_WORD_RE.search(sent.text.lower()):
                     score *= 3.0
                     
                 # Bonus for numbered patterns that look like chapter headings
-                if re.search(r'^\s*(\d+|[ivxlcdm]+|[IVXLCDM]+)\.?\s+\w+', sent.text):
+                if _NUMBERED_HEADING_RE.search(sent.text):
                     score *= 2.5
                     
                 # Bonus for short sentences (likely titles)
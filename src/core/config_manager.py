@@ -80,7 +80,9 @@ class ConfigManager:
                 "speed": 1.0,
                 "style": "neutral",
                 "emotion": "",
-                "language": "en"
+                "language": "en",
+                "loudness_normalization": False,
+                "target_loudness": -16.0
             },
             "audio_settings": {
                 "normalize": True,
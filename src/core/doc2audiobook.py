@@ -4,7 +4,8 @@ Document to Audiobook converter module.
 
 import os
 import logging
-from typing import Dict, Any, List, Tuple, Optional, Union
+from contextlib import closing
+from typing import Dict, Any, Iterator, List, Tuple, Optional, Union
 from pathlib import Path
 from pydub import AudioSegment
 from .document_processor import DocumentProcessor
@@ -15,7 +16,7 @@ from .tts import enhanced
 EnhancedTTS = enhanced.EnhancedTTS
 from .config_manager import ConfigManager
 from .utils.error import error_handler
-from .models.tts import TTSSettings, AudioFile, ConversionResult
+from .models.tts import TTSSettings, VoiceSettings, OutputSettings, AudioFile, ConversionResult
 
 class DocToAudiobook:
     """Converts documents to audiobooks."""
@@ -41,6 +42,14 @@ class DocToAudiobook:
     def output_settings(self) -> Dict[str, Any]:
         """Get the output settings from config manager."""
         return self.config_manager.get_audio_settings()
+        
+    def update_voice_settings(self, settings: VoiceSettings) -> bool:
+        """Save the fields set in settings to the voice settings."""
+        return self.config_manager.set_voice_settings(settings.changes())
+        
+    def update_output_settings(self, settings: OutputSettings) -> bool:
+        """Save the fields set in settings to the output (audio) settings."""
+        return self.config_manager.set_audio_settings(settings.changes())
 
     def create_audiobook(self, 
                         input_file: str, 
@@ -59,6 +68,24 @@ class DocToAudiobook:
         Returns:
             Either a dictionary with conversion results or a tuple of (status, output_files)
         """
+        result = None
+        for event in self.create_audiobook_iter(input_file, output_dir, style_map, max_chapters):
+            result = event.get("result", result)
+        return result
+        
+    def create_audiobook_iter(self, 
+                              input_file: str, 
+                              output_dir: str,
+                              style_map: Dict[str, Any] = None,
+                              max_chapters: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Convert a document to an audiobook, yielding progress as it goes.
+        
+        Yields {"stage": description, "pct": percent complete} at each major
+        step (text extraction, chapter detection, each chapter, combining). The
+        last event has stage "done" and carries the create_audiobook result
+        under "result".
+        """
         try:
             # Get settings from config
             voice_settings = TTSSettings.from_dict(self.voice_settings)
@@ -80,6 +107,7 @@ class DocToAudiobook:
             os.makedirs(output_dir, exist_ok=True)
             
             # Process document
+            yield {"stage": "Extracting text...", "pct": 0.0}
             text, metadata = self.document_processor.process_document(input_file)
             
             # Log the total document size to verify content
@@ -89,77 +117,89 @@ class DocToAudiobook:
                 self.logger.info(f"Large document - last 100 chars: ...{text[-100:]}")
             
             # Detect chapters
+            yield {"stage": "Detecting chapters...", "pct": 5.0}
             self.logger.info(f"Detecting chapters from text of length {len(text)}")
             chapters = self.chapter_manager.detect_chapters(text, max_chapters=max_chapters)
             
             # Generate audio for each chapter
-            output_files = []
             successful_chapters = 0
             
-            for i, chapter_tuple in enumerate(chapters):
-                try:
-                    # Unpack the tuple
-                    chapter_title, chapter_text = chapter_tuple
-                    
-                    # Skip empty chapters
-                    if not chapter_text or not chapter_text.strip():
-                        self.logger.warning(f"Skipping empty chapter {i+1}")
-                        continue
-                        
-                    self.logger.info(f"Processing chapter {i+1}: {chapter_title} ({len(chapter_text)} chars)")
+            # Skip empty chapters
+            batch = []
+            for i, (chapter_title, chapter_text) in enumerate(chapters):
+                if not chapter_text or not chapter_text.strip():
+                    self.logger.warning(f"Skipping empty chapter {i+1}")
+                    continue
+                batch.append(i)
                 
-                    # Generate speech
-                    audio_path = os.path.join(output_dir, f"chapter_{i+1:03d}_temp.mp3")
+            # Every chapter's TTS requests share one pool, and each chapter is
+            # enhanced as soon as its audio arrives; results come back as chapters finish
+            self.logger.info(f"Generating audio for {len(batch)} chapters with style: {voice_settings.style}")
+            yield {"stage": f"Converting {len(batch)} chapters...", "pct": 10.0}
+            chapter_files = {}
+            results = self.tts_engine.iter_audio_batch([chapters[i][1] for i in batch], voice_settings)
+            
+            with closing(results):
+                for done, (position, audio) in enumerate(results, 1):
+                    i = batch[position]
+                    chapter_title, chapter_text = chapters[i]
                     
-                    # Call OpenAI TTS API through our enhanced TTS engine
-                    self.logger.info(f"Generating audio for chapter {i+1} with style: {voice_settings.style}")
-                    audio = self.tts_engine.generate_audio(chapter_text, voice_settings)
-                
-                    # Validate audio output
-                    if audio is None:
-                        self.logger.error("TTS engine returned None")
-                        raise ValueError("TTS engine returned None")
+                    try:
+                        if isinstance(audio, Exception):
+                            raise audio
+                            
+                        # Validate audio output
+                        if not isinstance(audio, AudioSegment):
+                            self.logger.error(f"Invalid audio object returned from TTS engine: {type(audio)}")
+                            raise ValueError(f"TTS engine returned invalid audio type: {type(audio)}")
+                            
+                        self.logger.info(f"Processing chapter {i+1}: {chapter_title} ({len(chapter_text)} chars)")
                         
-                    if not isinstance(audio, AudioSegment):
-                        self.logger.error(f"Invalid audio object returned from TTS engine: {type(audio)}")
-                        raise ValueError(f"TTS engine returned invalid audio type: {type(audio)}")
-                    
-                    # Process audio with settings
-                    self.logger.info(f"Processing audio with settings: {audio_settings}")
-                    processed_audio = self.audio_processor.process_audio(audio, audio_settings)
-                    
-                    # Save chapter audio
-                    chapter_filename = f"chapter_{i+1:03d}.mp3"
-                    chapter_path = os.path.join(output_dir, chapter_filename)
-                    processed_audio.export(chapter_path, format="mp3")
-                    
-                    # Get audio duration
-                    duration = len(processed_audio) / 1000.0  # milliseconds to seconds
-                    
-                    # Add to output files
-                    output_files.append({
-                        'name': chapter_filename,
-                        'path': chapter_path,
-                        'title': chapter_title,
-                        'duration': duration,
-                        'size': os.path.getsize(chapter_path)
-                    })
-                    
-                    successful_chapters += 1
-                    self.logger.info(f"Successfully processed chapter {i+1}")
+                        # Process audio with settings
+                        self.logger.info(f"Processing audio with settings: {audio_settings}")
+                        processed_audio = self.audio_processor.process_audio(audio, audio_settings)
+                        
+                        # Save chapter audio
+                        chapter_filename = f"chapter_{i+1:03d}.mp3"
+                        chapter_path = os.path.join(output_dir, chapter_filename)
+                        processed_audio.export(chapter_path, format="mp3")
+                        
+                        # Get audio duration
+                        duration = len(processed_audio) / 1000.0  # milliseconds to seconds
+                        
+                        # Add to output files
+                        chapter_files[i] = {
+                            'name': chapter_filename,
+                            'path': chapter_path,
+                            'title': chapter_title,
+                            'duration': duration,
+                            'size': os.path.getsize(chapter_path)
+                        }
+                        
+                        successful_chapters += 1
+                        self.logger.info(f"Successfully processed chapter {i+1}")
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error processing chapter {i+1}: {e}")
+                        # Continue with next chapter instead of failing the whole process
+                        
+                    yield {
+                        "stage": f"Converted chapter {i+1} of {len(chapters)}: {chapter_title}",
+                        "pct": 10.0 + 80.0 * done / len(batch)
+                    }
                     
-                except Exception as e:
-                    self.logger.error(f"Error processing chapter {i+1}: {e}")
-                    # Continue with next chapter instead of failing the whole process
+            # Chapters finish out of order; list them in chapter order
+            output_files = [chapter_files[i] for i in sorted(chapter_files)]
                 
             # Check if we have any successful chapters
             if successful_chapters == 0:
                 self.logger.error("No chapters were successfully processed")
-                return {
+                yield {"stage": "done", "pct": 100.0, "result": {
                     "status": "failed",
                     "error": "No chapters were successfully processed",
                     "output_files": []
-                }
+                }}
+                return
                 
             # Verify we processed a reasonable amount of the original text
             # Calculate approximate content percentage processed
@@ -184,6 +224,7 @@ class DocToAudiobook:
             # Combine all chapter files into a single complete audiobook
             try:
                 self.logger.info(f"Combining {successful_chapters} chapters into complete audiobook")
+                yield {"stage": "Combining chapters...", "pct": 90.0}
                 
                 # Get all chapter file paths
                 chapter_paths = [file_info['path'] for file_info in output_files]
@@ -244,7 +285,7 @@ class DocToAudiobook:
             }
             
             self.logger.info(f"Conversion completed with status: {status}, {successful_chapters}/{len(chapters)} chapters processed")
-            return result_dict
+            yield {"stage": "done", "pct": 100.0, "result": result_dict}
             
         except Exception as e:
             error_handler.log_error(e, {
@@ -253,11 +294,11 @@ class DocToAudiobook:
                 'style_map': style_map
             })
             # Return structured failure result
-            return {
+            yield {"stage": "done", "pct": 100.0, "result": {
                 "status": "failed",
                 "error": str(e),
                 "output_files": []
-            }
+            }}
             
     def get_available_voices(self) -> List[str]:
         """Get list of available voices."""
@@ -3,14 +3,17 @@ Data models package for DocToAudiobook.
 
 This package provides data models for the application including:
 - TTS settings and configurations
+- Voice and output settings updates
 - Conversion result models
 - Audio file representations
 """
 
-from .tts import TTSSettings, AudioFile, ConversionResult
+from .tts import TTSSettings, VoiceSettings, OutputSettings, AudioFile, ConversionResult
 
 __all__ = [
     'TTSSettings',
+    'VoiceSettings',
+    'OutputSettings',
     'AudioFile',
     'ConversionResult'
 ] 
\ No newline at end of file
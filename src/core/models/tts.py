@@ -23,10 +23,18 @@ class TTSSettings:
     equalization: bool = False
     compression: bool = False
     normalize: bool = True
+    loudness_normalization: bool = False  # EBU R128; replaces compression and normalize
+    target_loudness: float = -16.0  # LUFS
     
     # Advanced settings
     max_chunk_size: int = 4000  # Set to 4000 to respect OpenAI's 4096 character limit
     
+    @property
+    def has_enhancements(self) -> bool:
+        """Whether any audio enhancement step is enabled."""
+        return (self.noise_reduction or self.equalization or self.compression
+                or self.normalize or self.loudness_normalization)
+        
     def dict(self) -> Dict[str, Any]:
         """Convert settings to a dictionary."""
         return {
@@ -41,6 +49,8 @@ class TTSSettings:
             "equalization": self.equalization,
             "compression": self.compression,
             "normalize": self.normalize,
+            "loudness_normalization": self.loudness_normalization,
+            "target_loudness": self.target_loudness,
             "max_chunk_size": self.max_chunk_size
         }
         
@@ -59,9 +69,57 @@ class TTSSettings:
             equalization=data.get("equalization", False),
             compression=data.get("compression", False),
             normalize=data.get("normalize", True),
+            loudness_normalization=data.get("loudness_normalization", False),
+            target_loudness=data.get("target_loudness", -16.0),
             max_chunk_size=data.get("max_chunk_size", 4000)
         )
 
+@dataclass(frozen=True)
+class VoiceSettings:
+    """Voice settings update; fields left as None keep their configured value."""
+    
+    model: Optional[str] = None
+    voice_id: Optional[str] = None
+    speed: Optional[float] = None
+    style: Optional[str] = None
+    emotion: Optional[str] = None
+    loudness_normalization: Optional[bool] = None
+    target_loudness: Optional[float] = None
+    
+    def changes(self) -> Dict[str, Any]:
+        """Convert the fields that are set to a voice_settings config dictionary."""
+        changes = {
+            "model": self.model,
+            "voice": self.voice_id,
+            "speed": self.speed,
+            "style": self.style,
+            "emotion": self.emotion,
+            "loudness_normalization": self.loudness_normalization,
+            "target_loudness": self.target_loudness
+        }
+        return {key: value for key, value in changes.items() if value is not None}
+
+@dataclass(frozen=True)
+class OutputSettings:
+    """Output settings update; fields left as None keep their configured value."""
+    
+    format: Optional[str] = None
+    quality: Optional[str] = None
+    bitrate: Optional[str] = None
+    pause_between_chapters: Optional[int] = None
+    combine_chapters: Optional[bool] = None
+    
+    def changes(self) -> Dict[str, Any]:
+        """Convert the fields that are set to an audio_settings config dictionary."""
+        changes = {
+            "format": self.format,
+            "quality": self.quality,
+            "bitrate": self.bitrate,
+            "pause_between_chapters": self.pause_between_chapters,
+            "combine_chapters": self.combine_chapters
+        }
+        return {key: value for key, value in changes.items() if value is not None}
+
 @dataclass
 class AudioFile:
     """Represents an audio file."""
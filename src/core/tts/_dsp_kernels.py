@@ -0,0 +1,144 @@
+"""
+Compiled DSP kernels for the TTS enhancement pipeline.
+
+numba is optional: when it is missing, or the kernels fail to compile,
+HAVE_NUMBA is False and callers keep using their numpy/scipy implementations.
+The kernels are plain Python until compiled, so they must never be called in
+that case.
+
+The kernels are not cached on disk: this module is imported both as
+core.tts._dsp_kernels and src.core.tts._dsp_kernels, and a numba cache written
+under one name cannot be loaded under the other.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+HAVE_NUMBA = njit is not None
+
+_warmed_up = False
+
+
+def sosfilt(sos: np.ndarray, samples: np.ndarray) -> np.ndarray:
+    """
+    Run a cascade of second-order sections over float32 samples shaped (frames, channels).
+
+    Each section is a Direct Form II Transposed biquad with coefficient rows
+    laid out as scipy.signal.sosfilt expects (b0, b1, b2, a0, a1, a2; a0 == 1).
+    The recursion is serial in time, so channels are processed in parallel and
+    the whole cascade is applied per sample in one pass.
+    """
+    frames, channels = samples.shape
+    sections = sos.shape[0]
+    out = np.empty_like(samples)
+
+    for ch in prange(channels):
+        z = np.zeros((sections, 2))
+        for n in range(frames):
+            x = np.float64(samples[n, ch])
+            for s in range(sections):
+                y = sos[s, 0] * x + z[s, 0]
+                z[s, 0] = sos[s, 1] * x - sos[s, 4] * y + z[s, 1]
+                z[s, 1] = sos[s, 2] * x - sos[s, 5] * y
+                x = y
+            out[n, ch] = x
+
+    return out
+
+
+def envelope(levels: np.ndarray, attack_coeff: float, release_coeff: float) -> np.ndarray:
+    """
+    Follow the level of rectified samples shaped (frames, channels).
+
+    A one-pole smoother that uses attack_coeff while the level rises above the
+    envelope and release_coeff while it falls, so gain reduction engages on
+    the attack time and recovers on the release time.
+    """
+    frames, channels = levels.shape
+    out = np.empty(levels.shape)
+
+    for ch in prange(channels):
+        env = 0.0
+        for n in range(frames):
+            level = np.float64(levels[n, ch])
+            coeff = attack_coeff if level > env else release_coeff
+            env = (1.0 - coeff) * level + coeff * env
+            out[n, ch] = env
+
+    return out
+
+
+def dynamics(samples: np.ndarray, attack_coeff: float, release_coeff: float,
+             threshold_db: float, ratio: float,
+             compress: bool, normalize: bool, headroom_db: float) -> np.ndarray:
+    """
+    Apply envelope-following compression and peak normalization to float32 samples.
+
+    Compression uses the same attack/release envelope follower (see envelope)
+    and static curve as EnhancedTTS._apply_dynamics, computed sample by sample
+    per channel, and tracks each channel's peak on the way so normalization
+    only needs one extra scaling pass over the output.
+    """
+    frames, channels = samples.shape
+    out = np.empty_like(samples)
+    peaks = np.zeros(channels)
+    slope = (1.0 - 1.0 / ratio) / 20.0
+
+    for ch in prange(channels):
+        env = 0.0
+        peak = 0.0
+        for n in range(frames):
+            x = np.float64(samples[n, ch])
+            if compress:
+                level = abs(x)
+                coeff = attack_coeff if level > env else release_coeff
+                env = (1.0 - coeff) * level + coeff * env
+                over_db = 20.0 * np.log10(max(env, 1e-9)) - threshold_db
+                if over_db > 0.0:
+                    x *= 10.0 ** (-over_db * slope)
+            out[n, ch] = x
+            peak = max(peak, abs(x))
+        peaks[ch] = peak
+
+    if normalize and channels > 0:
+        peak = peaks.max()
+        if peak > 0.0:
+            scale = np.float32(10.0 ** (-headroom_db / 20.0) / peak)
+            for n in prange(frames):
+                for ch in range(channels):
+                    out[n, ch] *= scale
+
+    return out
+
+
+if HAVE_NUMBA:
+    sosfilt = njit(parallel=True, fastmath=True)(sosfilt)
+    envelope = njit(parallel=True, fastmath=True)(envelope)
+    dynamics = njit(parallel=True, fastmath=True)(dynamics)
+
+
+def warm_up() -> None:
+    """
+    Compile the kernels once per process.
+
+    If compilation fails HAVE_NUMBA is cleared, so callers use their
+    numpy/scipy paths from then on, and the error is re-raised.
+    """
+    global _warmed_up, HAVE_NUMBA
+    if not HAVE_NUMBA or _warmed_up:
+        return
+
+    samples = np.zeros((16, 1), dtype=np.float32)
+    try:
+        sosfilt(np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]]), samples)
+        envelope(samples, 0.5, 0.9)
+        dynamics(samples, 0.5, 0.9, -20.0, 4.0, True, True, 0.1)
+    except Exception:
+        HAVE_NUMBA = False
+        raise
+    _warmed_up = True
@@ -0,0 +1,36 @@
+"""
+Sample format conversion helpers for the TTS audio pipeline.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Full-scale factor between float samples in [-1, 1) and signed 16-bit PCM
+_S16_SCALE = np.float32(32768.0)
+
+
+def conv_flt_to_s16(samples: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert float32 samples in [-1, 1) to clipped, rounded int16 samples.
+    
+    Scaling and clipping run in place in a single float32 scratch buffer, and
+    rounding writes straight into the int16 output, so each stage is a single
+    vectorized ufunc pass with no further temporaries. numpy's allocator returns
+    suitably aligned buffers for its SIMD loops.
+    
+    Args:
+        samples: Float samples of any shape
+        out: Optional int16 array of the same shape to write into, e.g. a view
+            over a bytearray that becomes the AudioSegment's data
+        
+    Returns:
+        An int16 array of the same shape
+    """
+    scaled = np.multiply(samples, _S16_SCALE, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    
+    if out is None:
+        out = np.empty(scaled.shape, dtype=np.int16)
+    np.rint(scaled, out=out, casting='unsafe')
+    return out
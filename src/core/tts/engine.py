@@ -9,6 +9,7 @@ import openai
 from pydub import AudioSegment
 from ..models.tts import TTSSettings
 from ..utils.error import ErrorHandler
+from ..audio_arena import AudioArena
 from .cache import TTSCache
 # Import EnhancedTTS here to avoid circular import
 from .enhanced import EnhancedTTS
@@ -174,10 +175,13 @@ class TTSEngine:
     def _combine_audio_segments(self, segments: List[AudioSegment]) -> AudioSegment:
         """Combine multiple audio segments into one."""
         try:
-            combined = segments[0]
-            for segment in segments[1:]:
-                combined += segment
-            return combined
+            # Size the arena for the total duration so every segment is copied exactly once
+            first = segments[0]
+            arena = AudioArena(first.frame_rate, first.sample_width, first.channels,
+                               estimated_ms=sum(len(segment) for segment in segments))
+            for segment in segments:
+                arena.append_segment(segment)
+            return arena.to_audiosegment()
             
         except Exception as e:
             self.error_handler.log_error(e, {'segment_count': len(segments)})
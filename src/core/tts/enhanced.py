@@ -2,133 +2,373 @@
 Enhanced TTS module for audio quality improvements.
 """
 
+import asyncio
 import os
 import logging
-import tempfile
-import time
-from typing import Optional, Dict, Any, List
+import queue
+import threading
+import itertools
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 import re
-from pydub import AudioSegment, effects
-from pydub.effects import normalize, compress_dynamic_range
+import numpy as np
+from scipy import signal
+from pydub import AudioSegment
 from ..utils.error import ErrorHandler
 from ..models.tts import TTSSettings
+from ._sconv import conv_flt_to_s16
+from . import _dsp_kernels
+
+# pyloudnorm is optional; without it loudness normalization falls back to the pydub chain
+try:
+    import pyloudnorm as pyln
+except ImportError:
+    pyln = None
+
+# torch/torchaudio are optional; without them enhancement always runs on the CPU
+try:
+    import torch
+    import torchaudio.functional as AF
+except ImportError:
+    torch = None
+    AF = None
+
+# OpenAI TTS "pcm" responses are headerless 24 kHz, 16-bit signed, mono samples
+PCM_FRAME_RATE = 24000
+PCM_SAMPLE_WIDTH = 2
+PCM_CHANNELS = 1
+
+# Below this duration the host/device transfer costs more than the GPU saves
+GPU_MIN_DURATION_MS = 30_000
+
+# Dynamics settings shared by the CPU and GPU enhancement paths
+COMPRESSION_THRESHOLD_DB = -20.0
+COMPRESSION_RATIO = 4.0
+COMPRESSION_ATTACK_MS = 5.0
+COMPRESSION_RELEASE_MS = 50.0
+NORMALIZE_HEADROOM_DB = 0.1
+
+def _shelf_sos(kind: str, frequency: float, gain_db: float, frame_rate: int) -> np.ndarray:
+    """Build one second-order section for a low or high shelf (RBJ Audio EQ Cookbook, S=1)."""
+    a = 10 ** (gain_db / 40)
+    w0 = 2 * np.pi * frequency / frame_rate
+    cos_w0 = np.cos(w0)
+    alpha = np.sin(w0) / 2 * np.sqrt(2)
+    sqrt_a_alpha = 2 * np.sqrt(a) * alpha
+
+    if kind == "low":
+        b = [a * ((a + 1) - (a - 1) * cos_w0 + sqrt_a_alpha),
+             2 * a * ((a - 1) - (a + 1) * cos_w0),
+             a * ((a + 1) - (a - 1) * cos_w0 - sqrt_a_alpha)]
+        den = [(a + 1) + (a - 1) * cos_w0 + sqrt_a_alpha,
+               -2 * ((a - 1) + (a + 1) * cos_w0),
+               (a + 1) + (a - 1) * cos_w0 - sqrt_a_alpha]
+    elif kind == "high":
+        b = [a * ((a + 1) + (a - 1) * cos_w0 + sqrt_a_alpha),
+             -2 * a * ((a - 1) + (a + 1) * cos_w0),
+             a * ((a + 1) + (a - 1) * cos_w0 - sqrt_a_alpha)]
+        den = [(a + 1) - (a - 1) * cos_w0 + sqrt_a_alpha,
+               2 * ((a - 1) - (a + 1) * cos_w0),
+               (a + 1) - (a - 1) * cos_w0 - sqrt_a_alpha]
+    else:
+        raise ValueError(f"Unknown shelf type: {kind}")
+
+    return np.array(b + den) / den[0]
+
+def _smoothing_coeff(time_ms: float, frame_rate: int) -> float:
+    """One-pole smoothing coefficient for a time constant of time_ms at frame_rate."""
+    return float(np.exp(-1000.0 / (time_ms * frame_rate)))
+
+# Style -> (speed factor, shelf filters as (kind, frequency, gain_db))
+STYLE_EFFECTS = {
+    # Slightly faster, with a high boost for brightness
+    "cheerful": (1.05, (("high", 3000, 2.0),)),
+    "happy": (1.05, (("high", 3000, 2.0),)),
+    # Slightly slower, with a bass boost for warmth and a treble cut for darkness
+    "sad": (0.95, (("low", 200, 2.0), ("high", 3000, -2.0))),
+    # Faster, with a mid/high boost for clarity and energy
+    "excited": (1.1, (("high", 2000, 3.0),)),
+    # Slightly slower for gravitas, with a low-mid boost for depth
+    "serious": (0.98, (("low", 300, 2.5),)),
+}
+
+def _precompute_style_coeffs(frame_rate: int) -> Dict[str, Tuple[float, Optional[np.ndarray]]]:
+    """Build (speed factor, shelf SOS cascade or None) for every style at frame_rate."""
+    coeffs = {}
+    for style, (speed_factor, shelves) in STYLE_EFFECTS.items():
+        sections = [_shelf_sos(kind, frequency, gain_db, frame_rate)
+                    for kind, frequency, gain_db in shelves if gain_db != 0]
+        coeffs[style] = (speed_factor, np.vstack(sections) if sections else None)
+    return coeffs
+
+# Style coefficients by frame rate; the TTS PCM rate is filled in at import
+_STYLE_COEFFS: Dict[int, Dict[str, Tuple[float, Optional[np.ndarray]]]] = {
+    PCM_FRAME_RATE: _precompute_style_coeffs(PCM_FRAME_RATE)
+}
+
+def _loop_running() -> bool:
+    """Check whether the calling thread is inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 class EnhancedTTS:
     """Provides enhanced audio processing for TTS outputs."""
     
+    # Upper bound on TTS requests in flight at once for a single generate_audio or batch call
+    max_concurrent_requests = 8
+    
+    # Text boundary patterns, compiled once and shared by chunking and text enhancement
+    _SENT_RE = re.compile(r'(?<=[.!?])\s+')
+    _WORD_RE = re.compile(r'\S+')
+    _EXCLAIM_TABLE = str.maketrans('.', '!')
+    # Candidate chunk boundaries; the matching group index ranks the break
+    # (1 = paragraph, 2 = sentence, 3 = clause, 4 = word)
+    _SPLIT_RE = re.compile(r'(\s*\n\s*\n\s*)|((?<=[.!?])\s+)|((?<=[,;:])\s+)|(\s+)')
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize enhanced TTS processor."""
         self.logger = logger or logging.getLogger(__name__)
         self.error_handler = ErrorHandler()
+        self._cached_client = None
+        self._cached_client_key = None
+        self._loudness_meters: Dict[int, Any] = {}
+        
+        # Compile the numba kernels up front so the first chunk does not pay for it
+        try:
+            _dsp_kernels.warm_up()
+        except Exception as e:
+            self.logger.warning(f"Could not compile DSP kernels, using numpy/scipy instead: {e}")
+        
+    def _client(self, api_key: str):
+        """Return an OpenAI client for api_key, reusing the previous one when the key is unchanged."""
+        if self._cached_client is None or self._cached_client_key != api_key:
+            from ..utils.openai_helper import get_openai_client
+            self._cached_client = get_openai_client(api_key)
+            self._cached_client_key = api_key
+        return self._cached_client
         
     def enhance_audio(self, audio: AudioSegment, settings: TTSSettings) -> AudioSegment:
         """Apply audio enhancements based on settings."""
+        # Nothing to do when every enhancement is disabled
+        if not settings.has_enhancements:
+            return audio
+            
+        samples, frame_rate = self._to_ndarray(audio)
+        return self._from_ndarray(self._enhance_samples(samples, frame_rate, settings), frame_rate)
+        
+    def _enhance_samples(self, samples: np.ndarray, frame_rate: int, settings: TTSSettings) -> np.ndarray:
+        """Apply audio enhancements to float samples shaped (frames, channels)."""
+        if not settings.has_enhancements:
+            return samples
+            
         try:
+            # A single EBU R128 pass replaces both compression and peak normalization
+            use_loudness = settings.loudness_normalization and pyln is not None
+            if settings.loudness_normalization and pyln is None:
+                self.logger.warning("pyloudnorm is not installed, falling back to compression/normalization")
+            
+            # Long audio is processed on the GPU when one is available
+            if (not use_loudness and self._gpu_available()
+                    and samples.shape[0] > GPU_MIN_DURATION_MS * frame_rate // 1000):
+                return self._enhance_gpu(samples, frame_rate, settings)
+                
             # Apply audio enhancements based on settings
             if settings.noise_reduction:
-                audio = self._apply_noise_reduction(audio)
+                samples = self._apply_noise_reduction(samples)
                 
             if settings.equalization:
-                audio = self._apply_equalization(audio)
+                samples = self._apply_equalization(samples)
                 
-            if settings.compression:
-                audio = self._apply_compression(audio)
+            if use_loudness:
+                samples = self._apply_loudness_normalization(samples, frame_rate, settings.target_loudness)
+            elif settings.compression or settings.normalize:
+                samples = self._apply_dynamics(samples, frame_rate, settings.compression, settings.normalize)
                 
-            if settings.normalize:
-                audio = self._apply_normalization(audio)
-                
-            return audio
+            return samples
             
         except Exception as e:
             self.error_handler.log_error(e, {
-                'audio_length': len(audio),
+                'audio_length': len(samples) * 1000 // frame_rate,
                 'settings': settings.dict() if hasattr(settings, 'dict') else vars(settings)
             })
-            return audio  # Return original audio if enhancement fails
-            
-    def _apply_noise_reduction(self, audio: AudioSegment) -> AudioSegment:
-        """Apply noise reduction to audio segment."""
-        try:
-            # Noise reduction implementation using sox or other tools would go here
-            # For now, we'll just implement a simple high-pass filter to remove low-frequency noise
-            self.logger.debug("Applying noise reduction")
-            
-            # Create a temporary file for processing with external tools if needed
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_input:
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_output:
-                    try:
-                        # Export audio to temp file
-                        audio.export(temp_input.name, format="wav")
-                        
-                        # TODO: Implement actual noise reduction using external tools
-                        # For now, just return the original audio
-                        
-                        # Read processed audio
-                        return audio
-                    finally:
-                        # Clean up temp files
-                        os.remove(temp_input.name)
-                        os.remove(temp_output.name)
-        except Exception as e:
-            self.error_handler.log_error(e, {'audio_length': len(audio)})
-            return audio
-            
-    def _apply_equalization(self, audio: AudioSegment) -> AudioSegment:
-        """Apply equalization to audio segment."""
-        try:
-            self.logger.debug("Applying equalization")
-            
-            # Simple equalization: boost high frequencies for clarity
-            # Real implementation would use proper EQ filters
-            
-            # Create a temporary file for processing
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_input:
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_output:
-                    try:
-                        # Export audio to temp file
-                        audio.export(temp_input.name, format="wav")
-                        
-                        # TODO: Implement actual equalization using pydub or external tools
-                        # For now, just return the original audio
-                        
-                        # Read processed audio
-                        return audio
-                    finally:
-                        # Clean up temp files
-                        os.remove(temp_input.name)
-                        os.remove(temp_output.name)
-        except Exception as e:
-            self.error_handler.log_error(e, {'audio_length': len(audio)})
-            return audio
+            return samples  # Return original audio if enhancement fails
             
-    def _apply_compression(self, audio: AudioSegment) -> AudioSegment:
-        """Apply compression to audio segment."""
+    @staticmethod
+    def _pcm_to_ndarray(data, channels: int) -> np.ndarray:
+        """Convert 16-bit PCM bytes to float32 samples in [-1, 1) shaped (frames, channels)."""
+        pcm = np.frombuffer(data, dtype=np.int16).reshape(-1, channels)
+        return np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
+        
+    def _to_ndarray(self, audio: AudioSegment) -> Tuple[np.ndarray, int]:
+        """Extract float32 samples shaped (frames, channels) and the frame rate from an AudioSegment."""
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        return self._pcm_to_ndarray(audio.raw_data, audio.channels), audio.frame_rate
+        
+    def _from_ndarray(self, samples: np.ndarray, frame_rate: int) -> AudioSegment:
+        """Clip float samples shaped (frames, channels) back into a 16-bit AudioSegment."""
+        # Convert straight into the buffer the segment keeps, so there is no tobytes() copy
+        data = bytearray(samples.size * 2)
+        conv_flt_to_s16(samples, out=np.frombuffer(data, dtype=np.int16).reshape(samples.shape))
+        return AudioSegment(
+            data=data,
+            sample_width=2,
+            frame_rate=frame_rate,
+            channels=samples.shape[1]
+        )
+        
+    def _gpu_available(self) -> bool:
+        """Check whether torchaudio is installed and a CUDA device is present."""
+        return torch is not None and torch.cuda.is_available()
+        
+    def _enhance_gpu(self, samples: np.ndarray, frame_rate: int, settings: TTSSettings) -> np.ndarray:
+        """
+        Apply compression and normalization on a CUDA device with torchaudio.
+        
+        Mirrors the CPU chain: noise reduction and equalization are not yet
+        implemented there either, so only compression and normalization run.
+        """
+        self.logger.debug(f"Applying enhancements on GPU ({len(samples) / frame_rate:.2f} seconds)")
+        
+        x = torch.from_numpy(np.ascontiguousarray(samples.T)).to('cuda')
+        
+        if settings.compression:
+            # Same envelope and static curve as the CPU path; the attack/release
+            # follower is a serial recursion, so it runs on the CPU
+            envelope = self._envelope(np.abs(samples), frame_rate)
+            envelope = torch.from_numpy(np.ascontiguousarray(envelope.T)).to(x.device, x.dtype)
+            level_db = 20.0 * torch.log10(envelope.clamp_min(1e-9))
+            over_db = (level_db - COMPRESSION_THRESHOLD_DB).clamp_min(0.0)
+            x = x * torch.pow(10.0, -over_db * (1.0 - 1.0 / COMPRESSION_RATIO) / 20.0)
+            
+        if settings.normalize:
+            peak = x.abs().max()
+            if peak > 0:
+                x = AF.gain(x, float(-NORMALIZE_HEADROOM_DB - 20.0 * torch.log10(peak)))
+                
+        return x.T.contiguous().cpu().numpy()
+        
+    def _apply_noise_reduction(self, samples: np.ndarray) -> np.ndarray:
+        """Apply noise reduction to audio samples."""
+        self.logger.debug("Applying noise reduction")
+        
+        # TODO: Implement actual noise reduction (e.g. a high-pass filter for low-frequency noise)
+        # For now, just return the original audio
+        return samples
+        
+    def _apply_equalization(self, samples: np.ndarray) -> np.ndarray:
+        """Apply equalization to audio samples."""
+        self.logger.debug("Applying equalization")
+        
+        # TODO: Implement actual equalization (e.g. boost high frequencies for clarity)
+        # For now, just return the original audio
+        return samples
+        
+    def _apply_dynamics(self, samples: np.ndarray, frame_rate: int,
+                        compression: bool, normalize: bool) -> np.ndarray:
+        """
+        Apply compression and/or peak normalization as a single gain stage.
+        
+        The compressor gain curve and the normalization scale are folded into
+        one output buffer, so the samples are written once rather than per step.
+        """
         try:
-            self.logger.debug("Applying compression")
-            
-            # Apply dynamic range compression
-            # This makes quiet parts louder and loud parts quieter
-            processed = compress_dynamic_range(audio, threshold=-20.0, ratio=4.0, attack=5.0, release=50.0)
-            
-            return processed
+            if _dsp_kernels.HAVE_NUMBA:
+                # One compiled pass computes the envelope, gain and peak together
+                self.logger.debug(f"Applying dynamics (compression={compression}, normalize={normalize})")
+                try:
+                    return _dsp_kernels.dynamics(
+                        np.ascontiguousarray(samples, dtype=np.float32),
+                        _smoothing_coeff(COMPRESSION_ATTACK_MS, frame_rate),
+                        _smoothing_coeff(COMPRESSION_RELEASE_MS, frame_rate),
+                        COMPRESSION_THRESHOLD_DB, COMPRESSION_RATIO,
+                        compression, normalize, NORMALIZE_HEADROOM_DB
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Compiled dynamics kernel failed, using numpy instead: {e}")
+                
+            if compression:
+                self.logger.debug("Applying compression")
+                
+                # Track the signal level with an attack/release envelope follower,
+                # then reduce everything above the threshold by the compression ratio
+                gain = self._envelope(np.abs(samples), frame_rate)
+                np.maximum(gain, 1e-9, out=gain)
+                np.log10(gain, out=gain)
+                np.multiply(gain, 20.0, out=gain)
+                np.subtract(gain, COMPRESSION_THRESHOLD_DB, out=gain)
+                np.maximum(gain, 0.0, out=gain)
+                np.multiply(gain, -(1.0 - 1.0 / COMPRESSION_RATIO) / 20.0, out=gain)
+                np.power(10.0, gain, out=gain)
+                out = np.multiply(samples, gain, dtype=np.float32)
+            else:
+                out = samples.copy()
+                
+            if normalize:
+                self.logger.debug("Applying normalization")
+                
+                # Peak-normalize to NORMALIZE_HEADROOM_DB below full scale
+                peak = float(np.max(np.abs(out))) if out.size else 0.0
+                if peak > 0:
+                    np.multiply(out, np.float32(10 ** (-NORMALIZE_HEADROOM_DB / 20) / peak), out=out)
+                    
+            return out
             
         except Exception as e:
-            self.error_handler.log_error(e, {'audio_length': len(audio)})
-            return audio
+            self.error_handler.log_error(e, {'audio_length': len(samples) * 1000 // frame_rate})
+            return samples
             
-    def _apply_normalization(self, audio: AudioSegment) -> AudioSegment:
-        """Apply normalization to audio segment."""
+    def _envelope(self, levels: np.ndarray, frame_rate: int) -> np.ndarray:
+        """
+        Follow rectified samples shaped (frames, channels) with the compressor's attack and release.
+        
+        Rising levels are tracked with COMPRESSION_ATTACK_MS and falling ones with
+        COMPRESSION_RELEASE_MS, matching the attack/release of the pydub compressor
+        this replaced. The recursion switches coefficient per sample, so without
+        the compiled kernel it runs as a Python loop.
+        """
+        attack = _smoothing_coeff(COMPRESSION_ATTACK_MS, frame_rate)
+        release = _smoothing_coeff(COMPRESSION_RELEASE_MS, frame_rate)
+        
+        if _dsp_kernels.HAVE_NUMBA:
+            try:
+                return _dsp_kernels.envelope(np.ascontiguousarray(levels, dtype=np.float32), attack, release)
+            except Exception as e:
+                self.logger.warning(f"Compiled envelope kernel failed, using Python instead: {e}")
+                
+        envelope = np.empty(levels.shape)
+        for channel in range(levels.shape[1]):
+            env = 0.0
+            values = []
+            for level in levels[:, channel].tolist():
+                coeff = attack if level > env else release
+                env = (1.0 - coeff) * level + coeff * env
+                values.append(env)
+            envelope[:, channel] = values
+        return envelope
+        
+    def _apply_loudness_normalization(self, samples: np.ndarray, frame_rate: int, target_lufs: float) -> np.ndarray:
+        """Normalize integrated loudness (EBU R128) to target_lufs."""
         try:
-            self.logger.debug("Applying normalization")
-            
-            # Normalize audio to standard level
-            processed = normalize(audio, headroom=0.1)
+            self.logger.debug(f"Applying loudness normalization to {target_lufs} LUFS")
             
-            return processed
+            # Meters hold the K-weighting filters for a sample rate, so build each one once
+            meter = self._loudness_meters.get(frame_rate)
+            if meter is None:
+                meter = self._loudness_meters[frame_rate] = pyln.Meter(frame_rate)
+                
+            loudness = meter.integrated_loudness(samples)
+            if not np.isfinite(loudness):
+                # Silent (or too short to gate) audio has no measurable loudness
+                return samples
+                
+            return pyln.normalize.loudness(samples, loudness, target_lufs).astype(np.float32, copy=False)
             
         except Exception as e:
-            self.error_handler.log_error(e, {'audio_length': len(audio)})
-            return audio
+            self.error_handler.log_error(e, {'audio_length': len(samples) * 1000 // frame_rate, 'target_lufs': target_lufs})
+            return samples
             
     def _enhance_text_for_emotion(self, text: str, style: str, emotion: str) -> str:
         """
@@ -147,20 +387,16 @@ class EnhancedTTS:
             enhanced_text = f"[Cheerfully] {enhanced_text}"
             
             # Add occasional emphasis markers for important words
-            words = enhanced_text.split()
-            if len(words) > 10:
+            if next(itertools.islice(self._WORD_RE.finditer(enhanced_text), 10, None), None) is not None:
                 # Add emphasis to approximately 10% of words for longer texts
-                for i in range(len(words)):
-                    if i % 10 == 0 and len(words[i]) > 3:
-                        words[i] = f"*{words[i]}*"
-                enhanced_text = " ".join(words)
+                enhanced_text = self._emphasize_words(enhanced_text, 10)
                 
         elif style == "sad":
             # Add markers for sad tone
             enhanced_text = f"[With sadness] {enhanced_text}"
             
             # Slow down apparent pacing with occasional pauses
-            sentences = re.split(r'(?<=[.!?])\s+', enhanced_text)
+            sentences = self._SENT_RE.split(enhanced_text)
             for i in range(len(sentences)):
                 if i > 0 and i < len(sentences) - 1:
                     sentences[i] = sentences[i] + "..."
@@ -171,113 +407,102 @@ class EnhancedTTS:
             enhanced_text = f"[Excitedly] {enhanced_text}"
             
             # Add exclamation emphasis
-            enhanced_text = enhanced_text.replace('.', '!')
+            enhanced_text = enhanced_text.translate(self._EXCLAIM_TABLE)
             
             # Add emphasis to important words
-            words = enhanced_text.split()
-            for i in range(len(words)):
-                if i % 6 == 0 and len(words[i]) > 3:
-                    words[i] = f"*{words[i]}*"
-            enhanced_text = " ".join(words)
+            enhanced_text = self._emphasize_words(enhanced_text, 6)
             
         elif style == "serious":
             # Add markers for serious tone
             enhanced_text = f"[Seriously] {enhanced_text}"
             
             # Add more formal, deliberate pacing
-            sentences = re.split(r'(?<=[.!?])\s+', enhanced_text)
+            sentences = self._SENT_RE.split(enhanced_text)
             enhanced_text = ". ".join(sentences)
             
         return enhanced_text
         
+    def _emphasize_words(self, text: str, every: int) -> str:
+        """Wrap every Nth word (when longer than 3 chars) in emphasis markers."""
+        counter = itertools.count()
+        
+        def repl(match):
+            word = match.group(0)
+            if next(counter) % every == 0 and len(word) > 3:
+                return f"*{word}*"
+            return word
+            
+        return self._WORD_RE.sub(repl, text)
+        
     def _apply_audio_style_effects(self, audio: AudioSegment, style: str) -> AudioSegment:
         """
         Apply audio effects based on the style to enhance emotional quality.
         """
+        if style == "neutral" or not style:
+            return audio
+            
+        samples, frame_rate = self._to_ndarray(audio)
+        return self._from_ndarray(self._apply_style_samples(samples, frame_rate, style), frame_rate)
+        
+    def _apply_style_samples(self, samples: np.ndarray, frame_rate: int, style: str) -> np.ndarray:
+        """Apply style effects to float samples shaped (frames, channels)."""
         try:
             if style == "neutral" or not style:
-                return audio
-                
-            # Make a copy of the audio to avoid modifying the original
-            # AudioSegment doesn't have a copy() method, so we use a slice operation to clone it
-            processed = audio[:]
-                
-            if style == "cheerful" or style == "happy":
-                # Slightly increase tempo for cheerful tone
-                processed = self._adjust_speed(processed, 1.05)
-                # Slight boost to higher frequencies for brightness
-                processed = self._apply_high_shelf_filter(processed, 3000, gain_db=2.0)
-                
-            elif style == "sad":
-                # Slow tempo slightly for sad tone
-                processed = self._adjust_speed(processed, 0.95)
-                # Slight bass boost for warmth and reduce treble for darkness
-                processed = self._apply_low_shelf_filter(processed, 200, gain_db=2.0)
-                processed = self._apply_high_shelf_filter(processed, 3000, gain_db=-2.0)
+                return samples
                 
-            elif style == "excited":
-                # Faster tempo for excitement
-                processed = self._adjust_speed(processed, 1.1)
-                # Boost mids and highs for clarity and energy
-                processed = self._apply_high_shelf_filter(processed, 2000, gain_db=3.0)
+            coeffs = _STYLE_COEFFS.get(frame_rate)
+            if coeffs is None:
+                coeffs = _STYLE_COEFFS[frame_rate] = _precompute_style_coeffs(frame_rate)
                 
-            elif style == "serious":
-                # Slightly slower for gravitas
-                processed = self._adjust_speed(processed, 0.98)
-                # Boost low-mids for depth
-                processed = self._apply_low_shelf_filter(processed, 300, gain_db=2.5)
+            effect = coeffs.get(style)
+            if effect is None:
+                return samples
                 
+            speed_factor, sos = effect
+            processed = self._adjust_speed(samples, speed_factor)
+            if sos is not None:
+                processed = self._apply_sos(processed, sos)
             return processed
             
         except Exception as e:
-            self.error_handler.log_error(e, {'style': style, 'audio_length': len(audio)})
-            return audio
+            self.error_handler.log_error(e, {'style': style, 'audio_length': len(samples) * 1000 // frame_rate})
+            return samples
             
-    def _adjust_speed(self, audio: AudioSegment, speed_factor: float) -> AudioSegment:
-        """Adjust the speed of audio without changing pitch."""
+    def _adjust_speed(self, samples: np.ndarray, speed_factor: float) -> np.ndarray:
+        """Adjust the speed of audio by resampling."""
         try:
             if speed_factor == 1.0:
-                return audio
+                return samples
                 
-            # Simple speed adjustment using PyDub
+            # Simple speed adjustment by linear resampling
             # Note: This changes pitch, but it's a lightweight approach
-            frames = int(audio.frame_count() / speed_factor)
-            return audio._spawn(audio.raw_data, overrides={
-                "frame_rate": int(audio.frame_rate * speed_factor)
-            }).set_frame_rate(audio.frame_rate)
+            frames = int(samples.shape[0] / speed_factor)
+            positions = np.arange(frames, dtype=np.float64) * speed_factor
+            source = np.arange(samples.shape[0], dtype=np.float64)
+            
+            adjusted = np.empty((frames, samples.shape[1]), dtype=np.float32)
+            for channel in range(samples.shape[1]):
+                adjusted[:, channel] = np.interp(positions, source, samples[:, channel])
+            return adjusted
             
         except Exception as e:
             self.error_handler.log_error(e, {'speed_factor': speed_factor})
-            return audio
+            return samples
             
-    def _apply_low_shelf_filter(self, audio: AudioSegment, frequency: int, gain_db: float) -> AudioSegment:
-        """Apply a low shelf filter to boost or cut bass frequencies."""
-        try:
-            # For now, use a simplified approach with PyDub's default filter
-            # We could implement a more sophisticated filter later
-            if gain_db > 0:
-                return audio.low_shelf_filter(frequency, gain_db)
-            else:
-                return audio.low_shelf_filter(frequency, gain_db)
-        except Exception as e:
-            self.error_handler.log_error(e, {'frequency': frequency, 'gain_db': gain_db})
-            return audio
+    def _apply_sos(self, samples: np.ndarray, sos: np.ndarray) -> np.ndarray:
+        """Run a second-order-section cascade over float samples shaped (frames, channels)."""
+        if _dsp_kernels.HAVE_NUMBA:
+            try:
+                return _dsp_kernels.sosfilt(sos, np.ascontiguousarray(samples, dtype=np.float32))
+            except Exception as e:
+                self.logger.warning(f"Compiled sosfilt kernel failed, using scipy instead: {e}")
             
-    def _apply_high_shelf_filter(self, audio: AudioSegment, frequency: int, gain_db: float) -> AudioSegment:
-        """Apply a high shelf filter to boost or cut treble frequencies."""
-        try:
-            # For now, use a simplified approach with PyDub's default filter
-            if gain_db > 0:
-                return audio.high_shelf_filter(frequency, gain_db)
-            else:
-                return audio.high_shelf_filter(frequency, gain_db)
-        except Exception as e:
-            self.error_handler.log_error(e, {'frequency': frequency, 'gain_db': gain_db})
-            return audio
+        return signal.sosfilt(sos, samples, axis=0).astype(np.float32, copy=False)
             
     def _split_text_to_chunks(self, text: str, max_chunk_size: int) -> List[str]:
         """
-        Split text into chunks of max_chunk_size, trying to break at sentence boundaries.
+        Split text into chunks of max_chunk_size, preferring paragraph, then sentence,
+        then clause, then word boundaries.
         
         Args:
             text: The text to split
@@ -296,115 +521,35 @@ class EnhancedTTS:
                 
             self.logger.info(f"Splitting text of length {len(text)} into chunks of max {safe_max_size} chars")
             
-            chunks = []
-            current_chunk = ""
+            # Strip outer whitespace so chunks never start or end with a separator
+            text = text.strip()
             
-            # Split by paragraph breaks first for best natural chunking
-            paragraphs = re.split(r'\n\s*\n', text)
-            
-            for paragraph in paragraphs:
-                paragraph = paragraph.strip()
-                if not paragraph:
-                    continue
-                    
-                # If adding this paragraph would exceed chunk size, start a new chunk
-                if current_chunk and len(current_chunk) + len(paragraph) + 2 > safe_max_size:
-                    chunks.append(current_chunk)
-                    current_chunk = ""
-                
-                # If paragraph itself is too long, split it by sentences
-                if len(paragraph) > safe_max_size:
-                    self.logger.debug(f"Splitting long paragraph of {len(paragraph)} chars")
-                    
-                    # Try to split by sentences using regex for better accuracy
-                    sentences = re.split(r'(?<=[.!?])\s+', paragraph)
+            verified_chunks = []
+            chunk_start = 0
+            candidates = []  # (start, end, priority) split points inside the current chunk
+            
+            # Walk every candidate split point once; a sentinel at the end of the
+            # text flushes whatever remains. Lower priority values are better breaks.
+            split_points = ((m.start(), m.end(), m.lastindex) for m in self._SPLIT_RE.finditer(text))
+            for start, end, priority in itertools.chain(split_points, [(len(text), len(text), 0)]):
+                while start - chunk_start > safe_max_size:
+                    best = self._pick_break(candidates, chunk_start, safe_max_size)
                     
-                    for sentence in sentences:
-                        # If this sentence fits in the current chunk, add it
-                        if len(current_chunk) + len(sentence) + 1 <= safe_max_size:
-                            if current_chunk:
-                                current_chunk += " " + sentence
-                            else:
-                                current_chunk = sentence
-                        else:
-                            # If current chunk is not empty, add it to chunks
-                            if current_chunk:
-                                chunks.append(current_chunk)
-                            
-                            # If sentence itself is too long, split it further
-                            if len(sentence) > safe_max_size:
-                                self.logger.debug(f"Splitting very long sentence of {len(sentence)} chars")
-                                
-                                # First try to split by phrases/clauses
-                                phrases = re.split(r'(?<=[,;:])\s+', sentence)
-                                
-                                phrase_chunk = ""
-                                for phrase in phrases:
-                                    if len(phrase_chunk) + len(phrase) + 1 <= safe_max_size:
-                                        if phrase_chunk:
-                                            phrase_chunk += " " + phrase
-                                        else:
-                                            phrase_chunk = phrase
-                                    else:
-                                        # Save current phrase chunk
-                                        if phrase_chunk:
-                                            chunks.append(phrase_chunk)
-                                        
-                                        # If phrase itself is too long, split arbitrarily
-                                        if len(phrase) > safe_max_size:
-                                            # Split at word boundaries if possible
-                                            words = phrase.split()
-                                            word_chunk = ""
-                                            
-                                            for word in words:
-                                                if len(word_chunk) + len(word) + 1 <= safe_max_size:
-                                                    if word_chunk:
-                                                        word_chunk += " " + word
-                                                    else:
-                                                        word_chunk = word
-                                                else:
-                                                    if word_chunk:
-                                                        chunks.append(word_chunk)
-                                                    
-                                                    # If single word is too long (rare), split arbitrarily
-                                                    if len(word) > safe_max_size:
-                                                        for i in range(0, len(word), safe_max_size):
-                                                            chunks.append(word[i:i+safe_max_size])
-                                                    else:
-                                                        word_chunk = word
-                                            
-                                            # Add final word chunk
-                                            if word_chunk:
-                                                chunks.append(word_chunk)
-                                        else:
-                                            phrase_chunk = phrase
-                                
-                                # Add final phrase chunk
-                                if phrase_chunk:
-                                    chunks.append(phrase_chunk)
-                            else:
-                                current_chunk = sentence
-                else:
-                    # Add paragraph to current chunk or start a new chunk
-                    if current_chunk:
-                        current_chunk += "\n\n" + paragraph
+                    if best is not None:
+                        verified_chunks.append(text[chunk_start:best[0]])
+                        chunk_start = best[1]
+                        candidates = [c for c in candidates if c[0] >= chunk_start]
                     else:
-                        current_chunk = paragraph
-            
-            # Add final chunk if not empty
-            if current_chunk:
-                chunks.append(current_chunk)
+                        # No usable break (e.g. a single huge word), split arbitrarily
+                        verified_chunks.append(text[chunk_start:chunk_start + safe_max_size])
+                        chunk_start += safe_max_size
+                        candidates = []
+                
+                if priority:
+                    candidates.append((start, end, priority))
             
-            # Final verification: no chunk should exceed our safe limit
-            verified_chunks = []
-            for chunk in chunks:
-                if len(chunk) > safe_max_size:
-                    # If a chunk is still too large, force split it
-                    self.logger.warning(f"Found chunk of {len(chunk)} chars > {safe_max_size} limit, force splitting")
-                    for i in range(0, len(chunk), safe_max_size):
-                        verified_chunks.append(chunk[i:i+safe_max_size])
-                else:
-                    verified_chunks.append(chunk)
+            if chunk_start < len(text):
+                verified_chunks.append(text[chunk_start:])
             
             # Validate chunks
             total_chars = sum(len(chunk) for chunk in verified_chunks)
@@ -445,11 +590,29 @@ class EnhancedTTS:
             self.logger.info(f"Fallback chunking created {len(chunks)} chunks")
             return chunks
 
+    @staticmethod
+    def _pick_break(candidates: List[Tuple[int, int, int]], chunk_start: int,
+                    max_size: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Choose where to end a chunk among the (start, end, priority) breaks in its window.
+        
+        Breaks in the back half of the window win over earlier ones, since an early
+        break leaves a short chunk and costs an extra request. Among those, take the
+        furthest break whose priority is within one level of the best one.
+        """
+        usable = [c for c in candidates if c[0] > chunk_start]
+        late = [c for c in usable if c[0] - chunk_start >= max_size // 2] or usable
+        if not late:
+            return None
+            
+        best_priority = min(c[2] for c in late)
+        for candidate in reversed(late):
+            if candidate[2] <= best_priority + 1:
+                return candidate
+                
     def test_api_key(self) -> bool:
         """Test if the API key is valid."""
         try:
-            # Import our helper to get a clean OpenAI client
-            from ..utils.openai_helper import get_openai_client
             from ..config_manager import ConfigManager
             
             # Get API key from config manager
@@ -461,8 +624,8 @@ class EnhancedTTS:
                 return False
             
             try:
-                # Create a clean client using our helper  
-                client = get_openai_client(api_key)
+                # Reuse the client (and its connection pool) for this key
+                client = self._client(api_key)
                 
                 # Test the TTS API with a minimal request
                 response = client.audio.speech.create(
@@ -479,173 +642,331 @@ class EnhancedTTS:
             self.error_handler.log_error(e, {'context': 'API key validation'})
             return False
 
-    def generate_audio(self, text: str, settings: TTSSettings) -> AudioSegment:
-        """Generate audio from text using TTS."""
-        temp_path = None
-        try:
-            self.logger.info(f"Generating audio from text ({len(text)} chars)")
-            
-            # Import our helper to get a clean OpenAI client
-            from ..utils.openai_helper import get_openai_client
-            from ..config_manager import ConfigManager
-            
-            # Get API key from config manager
-            config_manager = ConfigManager()
-            api_key = config_manager.get_api_key()
-            
-            if not api_key:
-                raise ValueError("No API key configured")
-                
-            # Validate input text
-            if not text or not text.strip():
-                self.logger.error("Empty text provided for TTS generation")
-                raise ValueError("Cannot generate audio from empty text")
-            
-            # Create a temporary file for audio
-            temp_path = None
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
-                temp_path = tmp.name
-                self.logger.debug(f"Created temporary file: {temp_path}")
-            
-            # Trap any format errors early
-            if not os.path.exists(temp_path):
-                self.logger.error(f"Failed to create temporary file at {temp_path}")
-                raise IOError(f"Failed to create temporary file at {temp_path}")
-            
-            # Apply text enhancements for emotional style
-            enhanced_text = self._enhance_text_for_emotion(text, settings.style, settings.emotion)
-            self.logger.info(f"Enhanced text with style '{settings.style}' and emotion '{settings.emotion}'")
-            
-            # OpenAI TTS API has a 4096 character limit
-            # We'll split the text into chunks and process each one separately if needed
-            max_chunk_size = 4000  # Safe limit to stay under the 4096 character API restriction
-            
-            # Always split the text into chunks to be safe, even for smaller texts
-            total_chars = len(enhanced_text)
-            self.logger.info(f"Preparing text ({total_chars} chars) for processing")
-            
-            # Split text into manageable chunks for the API
-            chunks = self._split_text_to_chunks(enhanced_text, max_chunk_size)
-            self.logger.info(f"Split text into {len(chunks)} chunks (each ≤ {max_chunk_size} chars) for processing")
-            
-            # Process each chunk and combine the audio
-            combined_audio = None
-            
-            # Validate our chunks before processing
-            if not chunks:
-                self.logger.error(f"No text chunks to process! Original text length: {len(enhanced_text)}")
-                raise ValueError("Text chunking failed - no chunks created")
-                
-            # Log chunk details for debugging
-            total_chunk_chars = sum(len(c) for c in chunks)
-            self.logger.info(f"Preparing to process {len(chunks)} chunks with total {total_chunk_chars} characters")
-            
-            for i, text_chunk in enumerate(chunks):
-                self.logger.info(f"Processing chunk {i+1}/{len(chunks)} ({len(text_chunk)} chars)")
-                
-                # Generate audio with OpenAI TTS API
+    async def _request_chunk_async(self, client, semaphore: asyncio.Semaphore, label: str,
+                                   text_chunk: str, settings: TTSSettings):
+        """Request TTS audio for a single chunk, retrying transient failures."""
+        async with semaphore:
+            self.logger.info(f"Processing chunk {label} ({len(text_chunk)} chars)")
+            
+            # Call the API with retry logic
+            max_retries = 3
+            for retry in range(max_retries):
                 try:
-                    # Create a clean client using our helper
-                    client = get_openai_client(api_key)
-                    
-                    # Call the API with retry logic
-                    max_retries = 3
-                    response = None
-                    
-                    for retry in range(max_retries):
-                        try:
-                            self.logger.info(f"Calling OpenAI TTS API for chunk {i+1} (attempt {retry+1})")
-                            response = client.audio.speech.create(
-                                model=settings.model,
-                                voice=settings.voice,
-                                speed=settings.speed,
-                                input=text_chunk,
-                                response_format="mp3"
-                            )
-                            break
-                        except Exception as e:
-                            if retry == max_retries - 1:
-                                raise
-                            self.logger.warning(f"TTS API call failed (attempt {retry+1}): {e}, retrying...")
-                            time.sleep(1)  # Brief delay before retry
-                    
-                    if response is None:
-                        raise ValueError("Failed to get response from OpenAI TTS API after multiple attempts")
-                        
-                    # Create a temp file for this chunk
-                    chunk_temp_path = None
-                    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as chunk_tmp:
-                        chunk_temp_path = chunk_tmp.name
-                    
-                    # Save the audio to the temporary file
-                    with open(chunk_temp_path, 'wb') as f:
-                        f.write(response.content)
-                        
-                    # Verify the file was written correctly
-                    if os.path.getsize(chunk_temp_path) == 0:
-                        raise ValueError(f"OpenAI returned empty audio content for chunk {i+1}")
-                    
-                    # Load the audio segment
-                    chunk_audio = AudioSegment.from_mp3(chunk_temp_path)
-                    self.logger.info(f"Generated audio for chunk {i+1} with duration: {len(chunk_audio)/1000:.2f} seconds")
-                    
-                    # Add to combined audio
-                    if combined_audio is None:
-                        combined_audio = chunk_audio
-                    else:
-                        combined_audio += chunk_audio
-                    
-                    # Clean up temp file
-                    if chunk_temp_path and os.path.exists(chunk_temp_path):
-                        try:
-                            os.unlink(chunk_temp_path)
-                        except Exception as e:
-                            self.logger.warning(f"Error removing chunk temp file {chunk_temp_path}: {e}")
-                    
+                    self.logger.info(f"Calling OpenAI TTS API for chunk {label} (attempt {retry+1})")
+                    return await client.audio.speech.create(
+                        model=settings.model,
+                        voice=settings.voice,
+                        speed=settings.speed,
+                        input=text_chunk,
+                        response_format="pcm"
+                    )
                 except Exception as e:
-                    self.logger.error(f"Error processing chunk {i+1}: {e}")
-                    raise ValueError(f"Error generating audio for text chunk {i+1}: {str(e)}")
-            
-            # Save the combined audio to the main temp file
-            if combined_audio is None:
-                raise ValueError("Failed to generate any audio")
-                
-            combined_audio.export(temp_path, format="mp3")
-            
-            # Verify the file was written correctly
-            if os.path.getsize(temp_path) == 0:
-                raise ValueError("Generated empty audio file")
-            
-            # Load the audio segment for consistent return type
-            audio = AudioSegment.from_mp3(temp_path)
-            self.logger.info(f"Combined audio generated with total duration: {len(audio)/1000:.2f} seconds")
-            
-        except Exception as e:
-            self.logger.error(f"Error in OpenAI TTS API: {e}")
-            raise ValueError(f"Error generating audio: {str(e)}")
+                    if retry == max_retries - 1:
+                        self.logger.error(f"Error processing chunk {label}: {e}")
+                        raise ValueError(f"Error generating audio for text chunk {label}: {str(e)}")
+                    self.logger.warning(f"TTS API call failed (attempt {retry+1}): {e}, retrying...")
+                    await asyncio.sleep(1)  # Brief delay before retry
+                    
+    async def _request_chunks_async(self, api_key: str, chunks: List[str], settings: TTSSettings) -> List[Any]:
+        """Request TTS audio for all chunks concurrently, returning responses in chunk order."""
+        from ..utils.openai_helper import get_async_openai_client
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        # Every chunk shares the client's connection pool; leaving the block closes its transport
+        async with get_async_openai_client(api_key) as client:
+            return await asyncio.gather(*(
+                self._request_chunk_async(client, semaphore, f"{i+1}/{len(chunks)}", c, settings)
+                for i, c in enumerate(chunks)
+            ))
+            
+    def _get_api_key(self) -> str:
+        """Get the configured OpenAI API key."""
+        from ..config_manager import ConfigManager
+        
+        # Get API key from config manager
+        config_manager = ConfigManager()
+        api_key = config_manager.get_api_key()
+        
+        if not api_key:
+            raise ValueError("No API key configured")
+        return api_key
+        
+    def _prepare_chunks(self, text: str, settings: TTSSettings) -> List[str]:
+        """Validate text, apply emotional text enhancement and split it into API-sized chunks."""
+        # Validate input text
+        if not text or not text.strip():
+            self.logger.error("Empty text provided for TTS generation")
+            raise ValueError("Cannot generate audio from empty text")
+        
+        # Apply text enhancements for emotional style
+        enhanced_text = self._enhance_text_for_emotion(text, settings.style, settings.emotion)
+        self.logger.info(f"Enhanced text with style '{settings.style}' and emotion '{settings.emotion}'")
+        
+        # OpenAI TTS API has a 4096 character limit
+        # We'll split the text into chunks and process each one separately if needed
+        max_chunk_size = 4000  # Safe limit to stay under the 4096 character API restriction
+        
+        # Always split the text into chunks to be safe, even for smaller texts
+        total_chars = len(enhanced_text)
+        self.logger.info(f"Preparing text ({total_chars} chars) for processing")
+        
+        # Split text into manageable chunks for the API
+        chunks = self._split_text_to_chunks(enhanced_text, max_chunk_size)
+        self.logger.info(f"Split text into {len(chunks)} chunks (each ≤ {max_chunk_size} chars) for processing")
+        
+        # Validate our chunks before processing
+        if not chunks:
+            self.logger.error(f"No text chunks to process! Original text length: {len(enhanced_text)}")
+            raise ValueError("Text chunking failed - no chunks created")
+            
+        # Log chunk details for debugging
+        total_chunk_chars = sum(len(c) for c in chunks)
+        self.logger.info(f"Preparing to process {len(chunks)} chunks with total {total_chunk_chars} characters")
+        return chunks
+        
+    def _collect_pcm(self, responses: List[Any]) -> bytearray:
+        """Join chunk responses into one PCM buffer, in order."""
+        # Accumulate raw PCM bytes; building the AudioSegment once at the
+        # end avoids re-copying the running buffer
+        pcm_buffer = bytearray()
+        
+        for i, response in enumerate(responses):
+            # Verify the API returned audio content
+            if not response.content:
+                self.logger.error(f"Error processing chunk {i+1}: empty audio content")
+                raise ValueError(f"OpenAI returned empty audio content for chunk {i+1}")
+            
+            # Raw PCM needs no decoding, so chunks are joined by appending bytes
+            pcm_buffer.extend(response.content)
+            chunk_seconds = len(response.content) / (PCM_FRAME_RATE * PCM_SAMPLE_WIDTH * PCM_CHANNELS)
+            self.logger.info(f"Generated audio for chunk {i+1} with duration: {chunk_seconds:.2f} seconds")
+            
+        if not pcm_buffer:
+            raise ValueError("Failed to generate any audio")
+        return pcm_buffer
+        
+    def _render_pcm(self, pcm_buffer: bytearray, settings: TTSSettings) -> AudioSegment:
+        """Decode combined PCM once, apply enhancements and style effects, and build the AudioSegment."""
+        samples = self._pcm_to_ndarray(pcm_buffer, PCM_CHANNELS)
+        self.logger.info(f"Combined audio generated with total duration: {len(samples) / PCM_FRAME_RATE:.2f} seconds")
         
         # Apply enhancements if requested
         if settings.enhance:
             try:
-                audio = self.enhance_audio(audio, settings)
+                samples = self._enhance_samples(samples, PCM_FRAME_RATE, settings)
             except Exception as e:
                 self.logger.error(f"Error applying enhancements: {e}")
                 # Continue with unenhanced audio rather than failing
         
         # Apply style-specific audio effects
         try:
-            audio = self._apply_audio_style_effects(audio, settings.style)
+            samples = self._apply_style_samples(samples, PCM_FRAME_RATE, settings.style)
         except Exception as e:
             self.logger.error(f"Error applying style effects: {e}")
             # Continue with base audio rather than failing
         
-        # Final validation
-        if not isinstance(audio, AudioSegment):
-            self.logger.error(f"Invalid audio object after processing: {type(audio)}")
-            raise ValueError(f"Audio processing failed to return a valid AudioSegment object")
+        # Convert back to an AudioSegment only once, after all processing
+        return self._from_ndarray(samples, PCM_FRAME_RATE)
+        
+    async def _generate_pcm_async(self, text: str, settings: TTSSettings) -> bytearray:
+        """Request TTS audio for text and return the combined raw PCM."""
+        try:
+            self.logger.info(f"Generating audio from text ({len(text)} chars)")
+            
+            api_key = self._get_api_key()
+            chunks = self._prepare_chunks(text, settings)
+            
+            # Request all chunks concurrently; gather preserves chunk order
+            responses = await self._request_chunks_async(api_key, chunks, settings)
+            return self._collect_pcm(responses)
+            
+        except Exception as e:
+            self.logger.error(f"Error in OpenAI TTS API: {e}")
+            raise ValueError(f"Error generating audio: {str(e)}")
+            
+    async def agenerate_audio(self, text: str, settings: TTSSettings) -> AudioSegment:
+        """Coroutine version of generate_audio, for callers already running an event loop."""
+        pcm_buffer = await self._generate_pcm_async(text, settings)
+        
+        # Enhancement is CPU-bound, so run it off the event loop
+        loop = asyncio.get_running_loop()
+        audio = await loop.run_in_executor(None, self._render_pcm, pcm_buffer, settings)
+        
+        self.logger.debug("Successfully generated audio with duration: %.2f seconds", len(audio) / 1000)
+        return audio
+        
+    def generate_audio(self, text: str, settings: TTSSettings) -> AudioSegment:
+        """Generate audio from text using TTS, returned as an in-memory AudioSegment."""
+        # asyncio.run() cannot start a second loop inside a running one
+        if _loop_running():
+            raise RuntimeError("generate_audio() cannot be called from a running event loop; "
+                               "await agenerate_audio() instead")
+            
+        pcm_buffer = asyncio.run(self._generate_pcm_async(text, settings))
+        audio = self._render_pcm(pcm_buffer, settings)
+        
+        # Final validation (compiled out under python -O)
+        assert isinstance(audio, AudioSegment), f"Invalid audio object after processing: {type(audio)}"
             
-        self.logger.info(f"Successfully generated audio with duration: {len(audio)/1000:.2f} seconds")
+        self.logger.debug("Successfully generated audio with duration: %.2f seconds", len(audio) / 1000)
         return audio
+        
+    def iter_audio_batch(self, texts: List[str], settings: TTSSettings,
+                         max_in_flight: Optional[int] = None,
+                         enhance_workers: int = 2) -> Iterator[Tuple[int, Union[AudioSegment, Exception]]]:
+        """
+        Generate audio for several texts, overlapping API requests with enhancement.
+        
+        API requests for the chunks of every text share one client and one pool
+        of at most max_in_flight concurrent calls. As soon as all chunks of a
+        text have arrived, its PCM is handed to a pool of enhancement worker
+        threads, so DSP for finished texts runs while later requests are still
+        in flight.
+        
+        Args:
+            texts: The texts to convert, e.g. one per chapter
+            settings: TTS settings applied to every text
+            max_in_flight: Maximum concurrent API requests (defaults to max_concurrent_requests)
+            enhance_workers: Number of enhancement worker threads
+            
+        Yields:
+            (index, audio) for each text as it finishes, in completion order. A
+            text that fails yields (index, exception) instead; the others go on.
+            Closing the iterator early cancels the requests still in flight.
+        """
+        if not texts:
+            return
+            
+        api_key = self._get_api_key()
+        
+        pending: queue.Queue = queue.Queue()  # (index, pcm) waiting for enhancement
+        finished: queue.Queue = queue.Queue()  # (index, audio or exception), then a None sentinel
+        stop = threading.Event()
+        running: Dict[str, Any] = {}
+        
+        def enhance_worker():
+            while True:
+                item = pending.get()
+                if item is None:
+                    break
+                index, pcm_buffer = item
+                if stop.is_set():
+                    continue
+                try:
+                    finished.put((index, self._render_pcm(pcm_buffer, settings)))
+                except Exception as e:
+                    finished.put((index, e))
+                    
+        async def request_text(client, semaphore, index: int, text: str):
+            try:
+                chunks = self._prepare_chunks(text, settings)
+                responses = await asyncio.gather(*(
+                    self._request_chunk_async(client, semaphore, f"{index+1}.{i+1}/{len(chunks)}", c, settings)
+                    for i, c in enumerate(chunks)
+                ))
+                pending.put((index, self._collect_pcm(responses)))
+            except Exception as e:
+                self.logger.error(f"Error generating audio for text {index+1}: {e}")
+                finished.put((index, ValueError(f"Error generating audio: {str(e)}")))
+                
+        async def request_all():
+            from ..utils.openai_helper import get_async_openai_client
+            
+            # Publish the task before checking stop, so close() either sees it or we see stop
+            running["loop"], running["task"] = asyncio.get_running_loop(), asyncio.current_task()
+            if stop.is_set():
+                return
+                
+            semaphore = asyncio.Semaphore(max_in_flight or self.max_concurrent_requests)
+            async with get_async_openai_client(api_key) as client:
+                await asyncio.gather(*(request_text(client, semaphore, i, text) for i, text in enumerate(texts)))
+                
+        def run_requests():
+            # Requests run on their own thread and loop, so the caller's thread (or loop) is never blocked by them
+            try:
+                asyncio.run(request_all())
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self.logger.error(f"Error in OpenAI TTS API: {e}")
+            finally:
+                # Let the workers drain whatever was queued, then stop them
+                for _ in workers:
+                    pending.put(None)
+                for worker in workers:
+                    worker.join()
+                finished.put(None)
+                
+        workers = [threading.Thread(target=enhance_worker, daemon=True) for _ in range(max(1, enhance_workers))]
+        for worker in workers:
+            worker.start()
+        requester = threading.Thread(target=run_requests, daemon=True)
+        requester.start()
+        
+        reported = set()
+        try:
+            for index, result in iter(finished.get, None):
+                reported.add(index)
+                yield index, result
+                
+            # Texts lost to an unexpected failure of the request loop still get a result
+            for index in range(len(texts)):
+                if index not in reported:
+                    yield index, ValueError(f"Error generating audio for text {index+1}: request loop failed")
+        finally:
+            stop.set()
+            if "task" in running:
+                try:
+                    running["loop"].call_soon_threadsafe(running["task"].cancel)
+                except RuntimeError:
+                    pass  # The loop has already finished
+            requester.join()
+            
+    def generate_audio_batch(self, texts: List[str], settings: TTSSettings,
+                             max_in_flight: Optional[int] = None,
+                             enhance_workers: int = 2) -> List[AudioSegment]:
+        """
+        Generate audio for several texts with iter_audio_batch, returned in input order.
+        
+        Raises:
+            ValueError: If any text fails; the error names the first failing text
+        """
+        results: List[Optional[AudioSegment]] = [None] * len(texts)
+        errors: Dict[int, Exception] = {}
+        
+        for index, result in self.iter_audio_batch(texts, settings, max_in_flight, enhance_workers):
+            if isinstance(result, Exception):
+                errors[index] = result
+            else:
+                results[index] = result
+                
+        if errors:
+            index = min(errors)
+            raise ValueError(f"Error generating audio for text {index+1}: {str(errors[index])}")
+            
+        self.logger.info(f"Successfully generated audio for {len(results)} texts")
+        return results
+        
+    def save(self, audio: AudioSegment, output_path: str, format: str = "mp3") -> str:
+        """
+        Export generated audio to a file.
+        
+        Args:
+            audio: The audio returned by generate_audio
+            output_path: Destination file path
+            format: Output format passed to ffmpeg
+            
+        Returns:
+            The output path
+        """
+        audio.export(output_path, format=format)
+        
+        # Verify the file was written correctly
+        if os.path.getsize(output_path) == 0:
+            raise ValueError(f"Generated empty audio file at {output_path}")
+            
+        return output_path
             
     def cleanup(self):
         """Clean up resources."""
@@ -3,7 +3,7 @@ TTS models module for DocToAudiobook.
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class TTSSettings(BaseModel):
     """TTS settings and configurations."""
@@ -24,9 +24,9 @@ class TTSSettings(BaseModel):
     max_retries: int = Field(default=3, description="Maximum API retry attempts")
     timeout: int = Field(default=30, description="API timeout in seconds")
     
-    class Config:
-        """Pydantic model configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "voice": "alloy",
                 "model": "tts-1",
@@ -40,6 +40,7 @@ class TTSSettings(BaseModel):
                 "timeout": 30
             }
         }
+    )
 
 class TTSResponse(BaseModel):
     """TTS API response model."""
@@ -49,9 +50,9 @@ class TTSResponse(BaseModel):
     error: Optional[str] = Field(description="Error message if request failed")
     metadata: Optional[Dict[str, Any]] = Field(description="Additional metadata about the request")
     
-    class Config:
-        """Pydantic model configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "success": True,
                 "audio_path": "/path/to/audio.mp3",
@@ -62,4 +63,5 @@ class TTSResponse(BaseModel):
                     "format": "mp3"
                 }
             }
-        } 
\ No newline at end of file
+        }
+    ) 
\ No newline at end of file
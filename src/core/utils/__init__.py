@@ -9,7 +9,7 @@ This package provides utility functions and classes including:
 """
 
 from .error import ErrorHandler, error_handler
-from .openai_helper import get_openai_client
+from .openai_helper import get_openai_client, get_async_openai_client
 # Remove import of non-existent modules
 # from .config import ConfigManager
 # from .logging import setup_logging
@@ -19,7 +19,8 @@ from .openai_helper import get_openai_client
 __all__ = [
     'ErrorHandler',
     'error_handler',
-    'get_openai_client'
+    'get_openai_client',
+    'get_async_openai_client'
     # Remove references to non-existent modules
     # 'ConfigManager',
     # 'setup_logging',
@@ -3,7 +3,6 @@ Error handling utilities for DocToAudiobook.
 """
 
 import logging
-import traceback
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
 
@@ -17,18 +16,16 @@ class ErrorHandler:
     def log_error(self, error: Exception, context: Optional[Dict[str, Any]] = None) -> None:
         """Log an error with context information."""
         try:
-            error_info = {
-                'error': str(error),
-                'type': type(error).__name__,
-                'traceback': traceback.format_exc(),
-                'context': context or {}
-            }
-            
+            # Skip all formatting when error records would be filtered out anyway
+            if not self.logger.isEnabledFor(logging.ERROR):
+                return
+                
+            # The traceback is rendered from exc_info only if a handler emits the record
             self.logger.error(
-                "Error occurred: %s\nContext: %s\nTraceback: %s",
-                error_info['error'],
-                error_info['context'],
-                error_info['traceback']
+                "Error occurred: %s\nContext: %s",
+                error,
+                context or {},
+                exc_info=error
             )
         except Exception as e:
             # Fall back to basic logging if structured logging fails
@@ -36,6 +33,8 @@ class ErrorHandler:
             
     def wrap_method(self, method: Callable) -> Callable:
         """Decorator for wrapping methods with error handling."""
+        # Whether errors are logged is decided when one happens (in log_error), not
+        # here: decoration runs at import time, before the app configures logging
         @wraps(method)
         def wrapper(*args, **kwargs):
             try:
@@ -52,15 +51,14 @@ class ErrorHandler:
     def handle_errors(self, context: Optional[Dict[str, Any]] = None) -> Callable:
         """Decorator factory for handling errors with specific context."""
         def decorator(func: Callable) -> Callable:
+            # Build the error context once, at decoration time
+            error_context = dict(context or {}, function=func.__name__)
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    error_context = context.copy() if context else {}
-                    error_context.update({
-                        'function': func.__name__,
-                    })
                     self.log_error(e, error_context)
                     raise
             return wrapper
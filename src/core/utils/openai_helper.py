@@ -6,60 +6,98 @@ Utilities for handling OpenAI API interactions safely
 import os
 import sys
 import logging
+import functools
+import threading
 import httpx  # Import httpx
-from openai import OpenAI  # Import OpenAI at the module level
+from openai import OpenAI, AsyncOpenAI  # Import OpenAI at the module level
 
 logger = logging.getLogger(__name__)
 
-def get_openai_client(api_key: str = None) -> OpenAI:
+# Proxy variables httpx and the OpenAI SDK read from the environment
+_PROXY_ENV_VARS = (
+    "HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy",
+    "OPENAI_PROXY", "ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy"
+)
+
+_PROXY_SCRUBBED = False
+
+def _scrub_proxy_env() -> None:
+    """Remove proxy environment variables so OpenAI traffic never goes through a proxy."""
+    # (Still good practice, though we override the http client below)
+    global _PROXY_SCRUBBED
+    if _PROXY_SCRUBBED:
+        return
+        
+    for key in _PROXY_ENV_VARS:
+        os.environ.pop(key, None)
+    _PROXY_SCRUBBED = True
+
+# The environment is process-global, so scrubbing it once at import is enough
+_scrub_proxy_env()
+
+# Connection pool limits shared by the sync and async HTTP clients
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=32)
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP/2 client, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                # The transport carries the pool settings; proxies stay disabled
+                _HTTP_CLIENT = httpx.Client(
+                    transport=httpx.HTTPTransport(proxy=None, http2=True, limits=_HTTP_LIMITS),
+                    timeout=60.0
+                )
+    return _HTTP_CLIENT
+
+@functools.lru_cache(maxsize=4)
+def _build_client(api_key: str) -> OpenAI:
+    """Create an OpenAI client for api_key; cached so each key reuses one client and connection pool."""
+    # Create OpenAI client with API key, explicitly without using proxies
+    # The new OpenAI client doesn't accept 'proxies' directly anymore
+    return OpenAI(
+        api_key=api_key,
+        # All clients share one warm, proxy-free HTTP/2 connection pool
+        http_client=_get_http_client(),
+        timeout=60.0  # Set a reasonable timeout
+    )
+
+def get_openai_client(api_key: str = None, verify: bool = False) -> OpenAI:
     """
     Get a clean OpenAI client instance with proxy settings disabled.
     
+    Clients are cached per API key, so repeated calls are cheap.
+    
     Args:
         api_key (str, optional): The OpenAI API key. If not provided, will use environment variable.
+        verify (bool, optional): Check the key with a models.list() request. Only
+            the first successful verification per client makes the request.
         
     Returns:
         OpenAI: A configured OpenAI client instance.
     """
     try:
-        # Force disable all proxy settings environment variables
-        # (Still good practice, though we override the http client below)
-        os.environ["HTTP_PROXY"] = ""
-        os.environ["HTTPS_PROXY"] = ""
-        os.environ["http_proxy"] = ""
-        os.environ["https_proxy"] = ""
-        os.environ["OPENAI_PROXY"] = ""
-        
-        # Remove any existing proxy settings from environment
-        for key in list(os.environ.keys()):
-            if key.lower().endswith('_proxy'):
-                try:
-                    del os.environ[key]
-                except Exception:
-                    pass # Ignore if deletion fails
-        
         # Get API key from environment if not provided
         if not api_key:
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("No API key provided and OPENAI_API_KEY environment variable is not set")
         
-        # Create OpenAI client with API key, explicitly without using proxies
-        # The new OpenAI client doesn't accept 'proxies' directly anymore
-        client = OpenAI(
-            api_key=api_key,
-            # Configure the underlying httpx client via base_url's transport
-            http_client=httpx.Client(transport=httpx.HTTPTransport(proxy=None)),
-            timeout=60.0  # Set a reasonable timeout
-        )
+        client = _build_client(api_key)
         
         # Verify client is working with a simple request
-        try:
-            client.models.list() 
-            logger.debug("OpenAI client verified successfully.")
-        except Exception as e:
-            logger.error(f"Failed to verify OpenAI client after creation: {str(e)}")
-            raise ValueError(f"Failed to initialize OpenAI client: {str(e)}")
+        if verify and not getattr(client, "_verified", False):
+            try:
+                client.models.list()
+                client._verified = True
+                logger.debug("OpenAI client verified successfully.")
+            except Exception as e:
+                logger.error(f"Failed to verify OpenAI client after creation: {str(e)}")
+                raise ValueError(f"Failed to initialize OpenAI client: {str(e)}")
         
         return client
         
@@ -71,4 +109,31 @@ def get_openai_client(api_key: str = None) -> OpenAI:
         # Ensure original exception type and message are preserved if possible
         if isinstance(e, ValueError):
              raise
-        raise RuntimeError(f"An unexpected error occurred while creating the OpenAI client: {str(e)}") 
\ No newline at end of file
+        raise RuntimeError(f"An unexpected error occurred while creating the OpenAI client: {str(e)}")
+
+def get_async_openai_client(api_key: str = None) -> AsyncOpenAI:
+    """
+    Get an AsyncOpenAI client instance with proxy settings disabled.
+    
+    The client is bound to the event loop it is used in, so callers should
+    create one per asyncio.run() and use it as an async context manager so its
+    connection pool is closed when done.
+    
+    Args:
+        api_key (str, optional): The OpenAI API key. If not provided, will use environment variable.
+        
+    Returns:
+        AsyncOpenAI: A configured AsyncOpenAI client instance.
+    """
+    if not api_key:
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("No API key provided and OPENAI_API_KEY environment variable is not set")
+    
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(proxy=None, http2=True, limits=_HTTP_LIMITS)
+        ),
+        timeout=60.0
+    )
@@ -9,10 +9,7 @@ import sys
 import logging
 import platform
 import shutil
-import json
-import importlib
-import tempfile
-from pathlib import Path
+from importlib.metadata import distribution, PackageNotFoundError
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +38,8 @@ def check_dependencies():
     """Check if all required dependencies are installed."""
     logger.info("Checking dependencies...")
     
+    # Distribution names as published on PyPI (e.g. "python-docx", not "docx");
+    # only package metadata is read, nothing is imported
     required_packages = [
         "flask",
         "pydub",
@@ -54,9 +53,9 @@ def check_dependencies():
     all_installed = True
     for package in required_packages:
         try:
-            importlib.import_module(package)
-            logger.info(f"{package}: Installed")
-        except ImportError:
+            version = distribution(package).version
+            logger.info(f"{package}: Installed ({version})")
+        except PackageNotFoundError:
             logger.error(f"{package}: Not installed")
             all_installed = False
     
@@ -100,8 +99,14 @@ def check_openai_api_key():
         logger.warning("OpenAI API key not found. TTS functionality will not work.")
         return False
 
-def check_file_permissions():
-    """Check if the application has necessary file permissions."""
+def check_file_permissions(strict=False):
+    """
+    Check if the application has necessary file permissions.
+    
+    By default this asks the OS with os.access. With strict=True a probe file
+    is written and removed in each directory instead, for network filesystems
+    where access(2) does not reflect what the server will allow.
+    """
     logger.info("Checking file permissions...")
     
     data_dir = os.path.join(BASE_DIR, "data")
@@ -122,6 +127,14 @@ def check_file_permissions():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
         
+        if not strict:
+            if os.access(directory, os.W_OK):
+                logger.info(f"{directory}: Write permission OK")
+            else:
+                logger.error(f"{directory}: Write permission FAILED")
+                all_permissions_ok = False
+            continue
+        
         # Test write permission
         try:
             test_file = os.path.join(directory, ".test_write_permission")
@@ -142,6 +155,7 @@ def check_tts_functionality():
     try:
         from src.core.tts.enhanced import EnhancedTTS
         from src.core.models.tts import TTSSettings
+        import tempfile
         
         # Create TTS engine
         tts = EnhancedTTS()
@@ -223,33 +237,38 @@ def check_document_processing():
         logger.error(f"Error checking document processing: {e}")
         return False
 
-def run_full_diagnosis():
+def run_full_diagnosis(strict=False):
     """Run all diagnostic checks."""
     logger.info("Running full system diagnosis...")
     logger.info(f"Base directory: {BASE_DIR}")
     logger.info(f"Platform: {platform.platform()}")
     
-    # Run all checks
-    checks = {
-        "Python Version": check_python_version(),
-        "Dependencies": check_dependencies(),
-        "FFmpeg": check_ffmpeg(),
-        "OpenAI API Key": check_openai_api_key(),
-        "File Permissions": check_file_permissions(),
-        "Document Processing": check_document_processing()
-    }
+    # (name, check, names of checks that must pass first), run in order
+    checks = [
+        ("Python Version", check_python_version, []),
+        ("Dependencies", check_dependencies, []),
+        ("FFmpeg", check_ffmpeg, []),
+        ("OpenAI API Key", check_openai_api_key, []),
+        ("File Permissions", lambda: check_file_permissions(strict), []),
+        ("Document Processing", check_document_processing, []),
+        # The TTS test makes a real API call, so only run it when it can succeed
+        ("TTS Functionality", check_tts_functionality, ["OpenAI API Key", "Dependencies", "FFmpeg"])
+    ]
     
-    # TTS test is optional
-    if checks["OpenAI API Key"]:
-        checks["TTS Functionality"] = check_tts_functionality()
+    results = {}
+    for name, check, requires in checks:
+        if all(results.get(required) for required in requires):
+            results[name] = check()
+        else:
+            results[name] = None
     
     # Print summary
     logger.info("\n--- Diagnosis Summary ---")
     all_passed = True
-    for name, passed in checks.items():
-        status = "PASS" if passed else "FAIL"
+    for name, passed in results.items():
+        status = "SKIP" if passed is None else "PASS" if passed else "FAIL"
         logger.info(f"{name}: {status}")
-        all_passed = all_passed and passed
+        all_passed = all_passed and passed is not False
     
     return all_passed
 
@@ -265,17 +284,19 @@ if __name__ == "__main__":
     parser.add_argument("--tts", action="store_true", help="Test TTS functionality")
     parser.add_argument("--docs", action="store_true", help="Test document processing")
     parser.add_argument("--all", action="store_true", help="Run all checks")
+    parser.add_argument("--strict", action="store_true",
+                        help="Check file permissions by writing a probe file (for network filesystems)")
     
     args = parser.parse_args()
     
     # If no arguments provided, show help
-    if not any(vars(args).values()):
+    if not any(value for name, value in vars(args).items() if name != "strict"):
         parser.print_help()
         sys.exit(1)
     
     # Run selected checks
     if args.all:
-        success = run_full_diagnosis()
+        success = run_full_diagnosis(args.strict)
     else:
         success = True
         
@@ -292,7 +313,7 @@ if __name__ == "__main__":
             success = check_openai_api_key() and success
         
         if args.perms:
-            success = check_file_permissions() and success
+            success = check_file_permissions(args.strict) and success
         
         if args.tts:
             success = check_tts_functionality() and success
@@ -6,44 +6,38 @@ from pathlib import Path
 
 # Import our classes
 from core.config_manager import ConfigManager
-from core.tts.enhanced import EnhancedTTS
-from core.doc2audiobook import DocToAudiobook
+from core.models.tts import VoiceSettings, OutputSettings
 
-def main():
-    """Main entry point for the DocToAudiobook CLI."""
-    parser = argparse.ArgumentParser(
-        description='Convert documents to audiobooks with enhanced TTS capabilities',
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    
-    # Configure API key command
-    config_parser = subparsers.add_parser('config', help='Configure tool settings')
+def _add_config_arguments(config_parser):
+    """Add arguments for the config command."""
     config_parser.add_argument('--api-key', help='Set OpenAI API key')
     config_parser.add_argument('--show', action='store_true', help='Show current configuration')
-    
-    # Voice settings command
-    voice_parser = subparsers.add_parser('voice', help='Configure voice settings')
+
+def _add_voice_arguments(voice_parser):
+    """Add arguments for the voice command."""
     voice_parser.add_argument('--model', choices=['tts-1', 'tts-1-hd', 'gpt-4o-mini-tts'], 
                              help='TTS model to use')
     voice_parser.add_argument('--voice-id', help='Voice ID to use')
     voice_parser.add_argument('--speed', type=float, help='Speech rate (0.25 to 4.0)')
     voice_parser.add_argument('--style', help='Voice style (for steerable models)')
     voice_parser.add_argument('--emotion', help='Emotional quality (for steerable models)')
+    voice_parser.add_argument('--loudness-normalization', dest='loudness_normalization', action='store_true',
+                              default=None, help='Normalize loudness (EBU R128) instead of compressing and peak-normalizing')
+    voice_parser.add_argument('--no-loudness-normalization', dest='loudness_normalization', action='store_false',
+                              default=None, help='Use compression and peak normalization')
+    voice_parser.add_argument('--target-loudness', type=float, help='Target integrated loudness in LUFS (e.g. -16)')
     voice_parser.add_argument('--list', action='store_true', help='List available voice options')
-    
-    # Output settings command
-    output_parser = subparsers.add_parser('output', help='Configure output settings')
+
+def _add_output_arguments(output_parser):
+    """Add arguments for the output command."""
     output_parser.add_argument('--format', choices=['mp3', 'wav', 'ogg'], help='Output audio format')
     output_parser.add_argument('--quality', choices=['low', 'medium', 'high'], help='Audio quality')
     output_parser.add_argument('--bitrate', help='Audio bitrate (e.g., "192k")')
     output_parser.add_argument('--chapter-pause', type=int, help='Pause between chapters (ms)')
     output_parser.add_argument('--combine', type=bool, help='Combine chapters into one file')
-    
-    # Convert command
-    convert_parser = subparsers.add_parser('convert', help='Convert document to audiobook')
+
+def _add_convert_arguments(convert_parser):
+    """Add arguments for the convert command."""
     convert_parser.add_argument('input_file', help='Input document file (DOCX/PDF)')
     convert_parser.add_argument('--output-dir', help='Output directory')
     convert_parser.add_argument('--max-chapters', type=int, default=30, 
@@ -51,12 +45,45 @@ def main():
     convert_parser.add_argument('--use-ocr', type=bool, default=True, 
                               help='Use OCR for PDF text extraction')
     convert_parser.add_argument('--prompt', help='Custom chapter detection prompt')
+
+# Command name -> (help text, argument builder)
+COMMANDS = {
+    'config': ('Configure tool settings', _add_config_arguments),
+    'voice': ('Configure voice settings', _add_voice_arguments),
+    'output': ('Configure output settings', _add_output_arguments),
+    'convert': ('Convert document to audiobook', _add_convert_arguments),
+    'recent': ('Show recently processed files', None),
+}
+
+def build_parser(argv):
+    """
+    Build the argument parser for argv.
     
-    # Recent files command
-    recent_parser = subparsers.add_parser('recent', help='Show recently processed files')
+    Every command is listed for the top-level help, but only the requested
+    command gets its arguments attached.
+    """
+    parser = argparse.ArgumentParser(
+        description='Convert documents to audiobooks with enhanced TTS capabilities',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
     
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    
+    requested = argv[0] if argv else None
+    for name, (help_text, add_arguments) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == requested and add_arguments is not None:
+            add_arguments(command_parser)
+    
+    return parser
+
+def main():
+    """Main entry point for the DocToAudiobook CLI."""
     # Parse arguments, skipping the 'cli' argument itself
-    args = parser.parse_args(sys.argv[2:])
+    argv = sys.argv[2:]
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
     
     # Initialize config manager
     config_manager = ConfigManager()
@@ -96,7 +123,8 @@ def main():
     
     # Handle voice settings command
     elif args.command == 'voice':
-        converter = DocToAudiobook()
+        from core.doc2audiobook import DocToAudiobook
+        converter = DocToAudiobook(config_manager)
         
         if args.list:
             print("Available TTS Models:")
@@ -112,50 +140,45 @@ def main():
                 print(f"  {style_id}: {description}")
             return
         
-        # Create a settings dictionary for updating
-        settings = {}
-        if args.model:
-            settings["model"] = args.model
-        if args.voice_id:
-            settings["voice_id"] = args.voice_id
-        if args.speed is not None:
-            settings["speed"] = max(0.25, min(4.0, args.speed))  # Clamp to valid range
-        if args.style:
-            settings["style"] = args.style
-        if args.emotion:
-            settings["emotion"] = args.emotion
+        settings = VoiceSettings(
+            model=args.model or None,
+            voice_id=args.voice_id or None,
+            speed=max(0.25, min(4.0, args.speed)) if args.speed is not None else None,  # Clamp to valid range
+            style=args.style or None,
+            emotion=args.emotion or None,
+            loudness_normalization=args.loudness_normalization,
+            target_loudness=args.target_loudness
+        )
         
         # Update settings if any were provided
-        if settings:
+        changes = settings.changes()
+        if changes:
             if converter.update_voice_settings(settings):
                 print("Voice settings updated successfully")
-                for key, value in settings.items():
+                for key, value in changes.items():
                     print(f"  {key}: {value}")
             else:
                 print("Failed to update voice settings")
     
     # Handle output settings command
     elif args.command == 'output':
-        converter = DocToAudiobook()
+        from core.doc2audiobook import DocToAudiobook
+        converter = DocToAudiobook(config_manager)
         
-        # Create a settings dictionary for updating
-        settings = {}
-        if args.format:
-            settings["format"] = args.format
-        if args.quality:
-            settings["quality"] = args.quality
-        if args.bitrate:
-            settings["bitrate"] = args.bitrate
-        if args.chapter_pause is not None:
-            settings["pause_between_chapters"] = args.chapter_pause
-        if args.combine is not None:
-            settings["combine_chapters"] = args.combine
+        settings = OutputSettings(
+            format=args.format or None,
+            quality=args.quality or None,
+            bitrate=args.bitrate or None,
+            pause_between_chapters=args.chapter_pause,
+            combine_chapters=args.combine
+        )
         
         # Update settings if any were provided
-        if settings:
+        changes = settings.changes()
+        if changes:
             if converter.update_output_settings(settings):
                 print("Output settings updated successfully")
-                for key, value in settings.items():
+                for key, value in changes.items():
                     print(f"  {key}: {value}")
             else:
                 print("Failed to update output settings")
@@ -168,7 +191,8 @@ def main():
             return
         
         # Initialize converter
-        converter = DocToAudiobook()
+        from core.doc2audiobook import DocToAudiobook
+        converter = DocToAudiobook(config_manager)
         
         # Check API key
         if not converter.api_key:
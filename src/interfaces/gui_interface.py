@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import os
 import sys
+import queue
+import logging
+import threading
+from concurrent.futures import Future
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
@@ -10,6 +14,22 @@ from core.config_manager import ConfigManager
 from core.tts.enhanced import EnhancedTTS
 from core.doc2audiobook import DocToAudiobook
 
+logger = logging.getLogger(__name__)
+
+# Models that accept style and emotion instructions
+STEERABLE_MODELS = frozenset({"gpt-4o-mini-tts"})
+
+# Tk variable classes for non-string initial values in _build_form
+_VAR_TYPES = {bool: tk.BooleanVar, int: tk.IntVar, float: tk.DoubleVar}
+
+# Form widget constructors by kind, used by AudiobookConverterApp._build_form
+_WIDGET_FACTORIES = {
+    "combobox": lambda parent, var, **opts: ttk.Combobox(parent, textvariable=var, state="readonly", width=20, **opts),
+    "entry": lambda parent, var, **opts: ttk.Entry(parent, textvariable=var, width=20, **opts),
+    "spinbox": lambda parent, var, **opts: ttk.Spinbox(parent, textvariable=var, **opts),
+    "checkbutton": lambda parent, var, **opts: ttk.Checkbutton(parent, variable=var, **opts),
+}
+
 class AudiobookConverterApp:
     def __init__(self, root):
         """Initialize the GUI application."""
@@ -20,7 +40,27 @@ class AudiobookConverterApp:
         
         # Initialize converter
         self.config_manager = ConfigManager()
-        self.converter = DocToAudiobook()
+        self.converter = DocToAudiobook(self.config_manager)
+        
+        # Progress events and main-thread callbacks from worker threads, drained on the Tk main thread
+        self.progress_queue = queue.Queue()
+        self._conversion_future = None
+        self._conversion_output_dir = None
+        self._cancel_event = None
+        
+        # API key dialog, built on first use and then hidden/re-shown
+        self._api_dialog = None
+        
+        # Recent files currently shown in the listbox
+        self._recent_files_shown = None
+        
+        # Directories the file dialogs last opened in
+        self._last_input_dir = str(Path.home())
+        self._last_output_dir = str(Path.home())
+        
+        # Last widget states applied by on_model_change/on_style_change
+        self._last_steerable = None
+        self._last_custom_state = None
         
         # Create main interface
         self.create_widgets()
@@ -28,11 +68,13 @@ class AudiobookConverterApp:
         # Check API key on startup
         self.check_api_key()
         
-        # Load voice and model options
-        self.load_voice_options()
+        # Load voice and model options in the background; current settings are
+        # applied once they arrive
+        self.update_status("Loading options...")
+        threading.Thread(target=self._preload_options, daemon=True).start()
         
-        # Initialize with current settings
-        self.load_current_settings()
+        # Start draining messages from background threads
+        self._poll_progress()
     
     def check_api_key(self):
         """Check if API key is configured."""
@@ -51,12 +93,20 @@ class AudiobookConverterApp:
     
     def show_api_key_dialog(self):
         """Show dialog to configure API key."""
-        dialog = tk.Toplevel(self.root)
+        if self._api_dialog is not None and self._api_dialog.winfo_exists():
+            self._api_key_var.set(self.converter.api_key or "")
+            self._api_dialog.deiconify()
+            self._api_dialog.lift()
+            self._api_dialog.grab_set()
+            return
+        
+        dialog = self._api_dialog = tk.Toplevel(self.root)
         dialog.title("Configure API Key")
         dialog.geometry("400x150")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_api_key_dialog)
         
         # Center dialog on parent window
         x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (400 // 2)
@@ -72,7 +122,7 @@ class AudiobookConverterApp:
             text="Enter your OpenAI API key:"
         ).pack(pady=(0, 5), anchor=tk.W)
         
-        api_key_var = tk.StringVar(value=self.converter.api_key or "")
+        api_key_var = self._api_key_var = tk.StringVar(value=self.converter.api_key or "")
         api_key_entry = ttk.Entry(frame, textvariable=api_key_var, width=50, show="*")
         api_key_entry.pack(pady=5, fill=tk.X)
         
@@ -92,16 +142,21 @@ class AudiobookConverterApp:
         ttk.Button(
             button_frame, 
             text="Save", 
-            command=lambda: self.save_api_key(api_key_var.get(), dialog)
+            command=lambda: self.save_api_key(api_key_var.get())
         ).pack(side=tk.RIGHT, padx=5)
         
         ttk.Button(
             button_frame, 
             text="Cancel", 
-            command=dialog.destroy
+            command=self._hide_api_key_dialog
         ).pack(side=tk.RIGHT, padx=5)
     
-    def save_api_key(self, api_key, dialog):
+    def _hide_api_key_dialog(self):
+        """Hide the API key dialog so it can be shown again without rebuilding it."""
+        self._api_dialog.grab_release()
+        self._api_dialog.withdraw()
+    
+    def save_api_key(self, api_key):
         """Save API key to config."""
         if not api_key:
             messagebox.showerror("Error", "API key cannot be empty")
@@ -109,23 +164,50 @@ class AudiobookConverterApp:
         
         if self.converter.set_api_key(api_key):
             messagebox.showinfo("Success", "API key saved successfully")
-            dialog.destroy()
+            self._hide_api_key_dialog()
         else:
             messagebox.showerror("Error", "Failed to save API key")
     
-    def load_voice_options(self):
+    def _fetch_options(self):
+        """Fetch the available voices, models and style presets from the converter."""
+        return {
+            "voices": self.converter.get_available_voices(),
+            "models": self.converter.get_available_models(),
+            "styles": self.converter.get_voice_style_presets()
+        }
+    
+    def _preload_options(self):
+        """Fetch options off the Tk thread and queue them for the UI."""
+        options = self._fetch_options()
+        self.progress_queue.put(lambda: self._apply_preloaded(options))
+    
+    def _apply_preloaded(self, options):
+        """Fill the option widgets from preloaded options, then show the current settings."""
+        self.load_voice_options(options)
+        self.load_current_settings()
+        self.update_status("Ready")
+    
+    def load_voice_options(self, options=None):
         """Load available voice and model options."""
+        if options is None:
+            options = self._fetch_options()
+        
+        # Keep each option source; tuples keep combobox order, frozensets give O(1) lookups
+        self._voice_map = options["voices"]
+        self._model_map = options["models"]
+        self._style_map = options["styles"]
+        
         # Get available voice options
-        self.voice_options = list(self.converter.get_available_voices().keys())
-        self.voice_combobox['values'] = self.voice_options
+        self.voice_options = frozenset(self._voice_map)
+        self.voice_combobox['values'] = tuple(self._voice_map)
         
         # Get available model options
-        self.model_options = list(self.converter.get_available_models().keys())
-        self.model_combobox['values'] = self.model_options
+        self.model_options = frozenset(self._model_map)
+        self.model_combobox['values'] = tuple(self._model_map)
         
         # Get available style presets
-        self.style_presets = list(self.converter.get_voice_style_presets().keys())
-        self.style_combobox['values'] = ['custom'] + self.style_presets
+        self.style_presets = frozenset(self._style_map)
+        self.style_combobox['values'] = ('custom',) + tuple(self._style_map)
     
     def load_current_settings(self):
         """Load current settings into UI."""
@@ -138,7 +220,7 @@ class AudiobookConverterApp:
         if voice_settings.get("model") in self.model_options:
             self.model_var.set(voice_settings.get("model"))
         
-        self.speed_var.set(str(voice_settings.get("speed", 1.0)))
+        self.speed_var.set(voice_settings.get("speed", 1.0))
         
         # Style handling
         style = voice_settings.get("style", "neutral")
@@ -156,7 +238,7 @@ class AudiobookConverterApp:
         
         self.format_var.set(output_settings.get("format", "mp3"))
         self.quality_var.set(output_settings.get("quality", "high"))
-        self.chapter_pause_var.set(str(output_settings.get("pause_between_chapters", 1000)))
+        self.chapter_pause_var.set(output_settings.get("pause_between_chapters", 1000))
         self.combine_chapters_var.set(output_settings.get("combine_chapters", True))
         
         # Update UI based on model selection
@@ -166,12 +248,14 @@ class AudiobookConverterApp:
         """Update UI based on selected model."""
         model = self.model_var.get()
         
-        # Enable/disable style options based on model
-        steerable = model == "gpt-4o-mini-tts"
+        # Enable/disable style options based on model, only when that changes
+        steerable = model in STEERABLE_MODELS
         
-        state = "normal" if steerable else "disabled"
-        self.style_combobox.config(state=state)
-        self.emotion_entry.config(state=state)
+        if steerable != self._last_steerable:
+            state = ['!disabled'] if steerable else ['disabled']
+            self.style_combobox.state(state)
+            self.emotion_entry.state(state)
+            self._last_steerable = steerable
         
         # Update custom style field state
         self.on_style_change()
@@ -182,14 +266,20 @@ class AudiobookConverterApp:
         model = self.model_var.get()
         
         # Enable custom style field if "custom" is selected and model supports it
-        steerable = model == "gpt-4o-mini-tts"
+        steerable = model in STEERABLE_MODELS
         custom_selected = style == "custom"
         
-        state = "normal" if steerable and custom_selected else "disabled"
-        self.custom_style_entry.config(state=state)
+        enabled = steerable and custom_selected
+        if enabled != self._last_custom_state:
+            self.custom_style_entry.state(['!disabled'] if enabled else ['disabled'])
+            self._last_custom_state = enabled
     
     def create_widgets(self):
         """Create UI widgets."""
+        # Shared named styles, registered once instead of per-widget options
+        self.style = ttk.Style(self.root)
+        self.style.configure("Hint.TLabel", foreground="gray")
+        
         # Create notebook with tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -290,233 +380,140 @@ class AudiobookConverterApp:
         self.recent_listbox.bind("<Double-1>", self.select_recent_file)
         
         # Conversion button
-        convert_button = ttk.Button(
+        self.convert_button = ttk.Button(
             self.main_frame, 
             text="Convert to Audiobook", 
             command=self.start_conversion,
             style="Accent.TButton"
         )
-        convert_button.pack(pady=10, padx=50, ipady=5)
+        self.convert_button.pack(pady=10, padx=50, ipady=5)
         
-        # Progress bar
-        progress_var = tk.DoubleVar()
-        progress_bar = ttk.Progressbar(
+        # Progress widgets are built once and only shown while a conversion runs
+        self.progress_var = tk.DoubleVar()
+        self.progress_bar = ttk.Progressbar(
             self.main_frame, 
-            variable=progress_var, 
-            mode="indeterminate",
+            variable=self.progress_var, 
+            mode="determinate",
+            maximum=100,
             length=300
         )
-        progress_bar.pack(pady=5)
         
         # Progress Label
         self.progress_label = ttk.Label(self.main_frame, text="Initializing...")
-        self.progress_label.pack(pady=5)
-    
-    def create_voice_tab(self):
-        """Create voice settings tab."""
-        # Create form layout
-        form_frame = ttk.Frame(self.voice_frame, padding=5)
-        form_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # TTS Model
-        ttk.Label(form_frame, text="TTS Model:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.model_var = tk.StringVar()
-        self.model_combobox = ttk.Combobox(
-            form_frame, 
-            textvariable=self.model_var, 
-            state="readonly",
-            width=20
-        )
-        self.model_combobox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        self.model_combobox.bind("<<ComboboxSelected>>", self.on_model_change)
-        
-        ttk.Label(
-            form_frame, 
-            text="Select the TTS model to use", 
-            foreground="gray"
-        ).grid(row=0, column=2, sticky=tk.W, padx=5)
-        
-        # Voice ID
-        ttk.Label(form_frame, text="Voice:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.voice_var = tk.StringVar()
-        self.voice_combobox = ttk.Combobox(
-            form_frame, 
-            textvariable=self.voice_var, 
-            state="readonly",
-            width=20
-        )
-        self.voice_combobox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Select the voice identity", 
-            foreground="gray"
-        ).grid(row=1, column=2, sticky=tk.W, padx=5)
-        
-        # Speed
-        ttk.Label(form_frame, text="Speed:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.speed_var = tk.StringVar(value="1.0")
-        speed_entry = ttk.Spinbox(
-            form_frame, 
-            from_=0.25, 
-            to=4.0, 
-            increment=0.05,
-            textvariable=self.speed_var,
-            width=10
-        )
-        speed_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         
-        ttk.Label(
-            form_frame, 
-            text="Speech rate (0.25 to 4.0)", 
-            foreground="gray"
-        ).grid(row=2, column=2, sticky=tk.W, padx=5)
-        
-        # Style
-        ttk.Label(form_frame, text="Style:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.style_var = tk.StringVar(value="neutral")
-        self.style_combobox = ttk.Combobox(
-            form_frame, 
-            textvariable=self.style_var, 
-            state="readonly",
-            width=20
+        self.cancel_button = ttk.Button(
+            self.main_frame, 
+            text="Cancel", 
+            command=self.cancel_conversion
         )
-        self.style_combobox.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        self.style_combobox.bind("<<ComboboxSelected>>", self.on_style_change)
+    
+    def _build_form(self, parent, fields):
+        """
+        Build a label / widget / hint row in parent for each field spec.
+        
+        Each spec is (label, var_attr, widget_kind, hint, opts). The variable is
+        stored on the app as var_attr. opts may hold the initial "value", which
+        also picks the Tk variable type (StringVar when absent), a "widget_attr"
+        to store the widget under, an "on_select" combobox handler, and any
+        extra keyword arguments for the widget.
+        """
+        form_frame = ttk.Frame(parent, padding=5)
+        form_frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(
-            form_frame, 
-            text="Voice style preset (for steerable models)", 
-            foreground="gray"
-        ).grid(row=3, column=2, sticky=tk.W, padx=5)
+        for row, (label, var_attr, kind, hint, opts) in enumerate(fields):
+            opts = dict(opts)
+            widget_attr = opts.pop("widget_attr", None)
+            on_select = opts.pop("on_select", None)
+            if "value" in opts:
+                value = opts.pop("value")
+                var = _VAR_TYPES.get(type(value), tk.StringVar)(value=value)
+            else:
+                var = tk.StringVar()
+            setattr(self, var_attr, var)
+            
+            ttk.Label(form_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+            
+            widget = _WIDGET_FACTORIES[kind](form_frame, var, **opts)
+            widget.grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
+            if widget_attr:
+                setattr(self, widget_attr, widget)
+            if on_select:
+                widget.bind("<<ComboboxSelected>>", on_select)
+            
+            if hint:
+                ttk.Label(
+                    form_frame, 
+                    text=hint, 
+                    style="Hint.TLabel"
+                ).grid(row=row, column=2, sticky=tk.W, padx=5)
+    
+    def create_voice_tab(self):
+        """Create voice settings tab."""
+        self._build_form(self.voice_frame, [
+            ("TTS Model:", "model_var", "combobox", "Select the TTS model to use",
+             {"widget_attr": "model_combobox", "on_select": self.on_model_change}),
+            ("Voice:", "voice_var", "combobox", "Select the voice identity",
+             {"widget_attr": "voice_combobox"}),
+            ("Speed:", "speed_var", "spinbox", "Speech rate (0.25 to 4.0)",
+             {"value": 1.0, "from_": 0.25, "to": 4.0, "increment": 0.05, "width": 10}),
+            ("Style:", "style_var", "combobox", "Voice style preset (for steerable models)",
+             {"value": "neutral", "widget_attr": "style_combobox", "on_select": self.on_style_change}),
+        ])
     
     def create_output_tab(self):
         """Create output settings tab."""
-        # Create form layout
-        form_frame = ttk.Frame(self.output_frame, padding=5)
-        form_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Format
-        ttk.Label(form_frame, text="Format:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.format_var = tk.StringVar(value="mp3")
-        format_combobox = ttk.Combobox(
-            form_frame, 
-            textvariable=self.format_var, 
-            state="readonly",
-            width=20
-        )
-        format_combobox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Select the output format", 
-            foreground="gray"
-        ).grid(row=0, column=2, sticky=tk.W, padx=5)
-        
-        # Quality
-        ttk.Label(form_frame, text="Quality:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.quality_var = tk.StringVar(value="high")
-        quality_combobox = ttk.Combobox(
-            form_frame, 
-            textvariable=self.quality_var, 
-            state="readonly",
-            width=20
-        )
-        quality_combobox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Select the output quality", 
-            foreground="gray"
-        ).grid(row=1, column=2, sticky=tk.W, padx=5)
-        
-        # Chapter pause
-        ttk.Label(form_frame, text="Chapter Pause:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.chapter_pause_var = tk.StringVar(value="1000")
-        chapter_pause_entry = ttk.Entry(
-            form_frame, 
-            textvariable=self.chapter_pause_var, 
-            width=20
-        )
-        chapter_pause_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Pause between chapters (ms)", 
-            foreground="gray"
-        ).grid(row=2, column=2, sticky=tk.W, padx=5)
-        
-        # Combine chapters
-        ttk.Label(form_frame, text="Combine Chapters:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.combine_chapters_var = tk.BooleanVar(value=True)
-        combine_chapters_check = ttk.Checkbutton(
-            form_frame, 
-            text="Combine chapters", 
-            variable=self.combine_chapters_var
-        )
-        combine_chapters_check.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        self._build_form(self.output_frame, [
+            ("Format:", "format_var", "combobox", "Select the output format", {"value": "mp3"}),
+            ("Quality:", "quality_var", "combobox", "Select the output quality", {"value": "high"}),
+            ("Chapter Pause:", "chapter_pause_var", "entry", "Pause between chapters (ms)", {"value": 1000}),
+            ("Combine Chapters:", "combine_chapters_var", "checkbutton", None,
+             {"value": True, "text": "Combine chapters"}),
+        ])
     
     def create_advanced_tab(self):
         """Create advanced settings tab."""
-        # Create form layout
-        form_frame = ttk.Frame(self.advanced_frame, padding=5)
-        form_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Emotion
-        ttk.Label(form_frame, text="Emotion:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.emotion_var = tk.StringVar()
-        emotion_entry = ttk.Entry(
-            form_frame, 
-            textvariable=self.emotion_var, 
-            width=20
-        )
-        emotion_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Enter emotion description", 
-            foreground="gray"
-        ).grid(row=0, column=2, sticky=tk.W, padx=5)
-        
-        # Custom style
-        ttk.Label(form_frame, text="Custom Style:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.custom_style_var = tk.StringVar()
-        custom_style_entry = ttk.Entry(
-            form_frame, 
-            textvariable=self.custom_style_var, 
-            width=20
-        )
-        custom_style_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(
-            form_frame, 
-            text="Enter custom style description", 
-            foreground="gray"
-        ).grid(row=1, column=2, sticky=tk.W, padx=5)
+        self._build_form(self.advanced_frame, [
+            ("Emotion:", "emotion_var", "entry", "Enter emotion description",
+             {"widget_attr": "emotion_entry"}),
+            ("Custom Style:", "custom_style_var", "entry", "Enter custom style description",
+             {"widget_attr": "custom_style_entry"}),
+        ])
     
     def browse_input_file(self):
         """Open file dialog to select input file."""
         file_path = filedialog.askopenfilename(
+            parent=self.root,
+            initialdir=self._last_input_dir,
             title="Select Input Document",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
         )
         if file_path:
             self.input_file_var.set(file_path)
+            self._last_input_dir = str(Path(file_path).parent)
     
     def browse_output_dir(self):
         """Open directory dialog to select output directory."""
         dir_path = filedialog.askdirectory(
+            parent=self.root,
+            initialdir=self._last_output_dir,
             title="Select Output Directory"
         )
         if dir_path:
             self.output_dir_var.set(dir_path)
+            self._last_output_dir = dir_path
     
     def load_recent_files(self):
         """Load recent files from config."""
-        recent_files = self.config_manager.get_recent_files()
-        self.recent_listbox.delete(0, tk.END)
-        for file in recent_files:
-            self.recent_listbox.insert(tk.END, file)
+        recent_files = tuple(self.config_manager.get_recent_files())
+        if recent_files == self._recent_files_shown:
+            return  # Unchanged, so there is nothing to redraw
+        self._recent_files_shown = recent_files
+        
+        if self.recent_listbox.size():
+            self.recent_listbox.delete(0, tk.END)
+        # One variadic insert is a single Tcl call instead of one per file
+        if recent_files:
+            self.recent_listbox.insert(tk.END, *recent_files)
     
     def select_recent_file(self, event):
         """Select a recent file from the listbox."""
@@ -533,90 +530,187 @@ class AudiobookConverterApp:
             messagebox.showerror("Error", "Please specify both input file and output directory")
             return
         
-        progress_var = tk.DoubleVar()
-        progress_bar = ttk.Progressbar(
-            self.main_frame, 
-            variable=progress_var, 
-            mode="indeterminate",
-            length=300
-        )
-        progress_bar.pack(pady=5)
+        # Block further clicks until this conversion has finished
+        self.convert_button.state(['disabled'])
         
-        status_label = ttk.Label(self.main_frame, text="Initializing...")
-        status_label.pack(pady=5)
-        
-        cancel_button = ttk.Button(
-            self.main_frame, 
-            text="Cancel", 
-            command=self.progress_dialog.destroy
-        )
-        cancel_button.pack(pady=10)
-        
-        # Update UI
-        self.root.update()
+        # Show the progress widgets
+        self.progress_label.config(text="Initializing...")
+        self.progress_var.set(0)
+        self.progress_bar.pack(pady=5)
+        self.progress_label.pack(pady=5)
+        self.cancel_button.pack(pady=10)
         
-        # Define update callback for progress (simplified)
-        def update_status_display(message):
-            status_label.config(text=message)
-            self.root.update() # Keep UI responsive
+        # Draw the progress widgets now without processing queued events
+        self.root.update_idletasks()
         
-        # Run conversion in a separate thread
-        import threading
+        # The conversion's Future is posted back through the queue once it settles,
+        # so its result is always handled on the Tk main thread
+        self._conversion_output_dir = output_dir
+        future = self._conversion_future = Future()
+        future.add_done_callback(lambda done: self.progress_queue.put(lambda: self._finish_conversion(done)))
+        cancel_event = self._cancel_event = threading.Event()
         
+        # The worker never touches Tk widgets; it only posts messages for _poll_progress
         def conversion_thread():
-            # Start indeterminate progress bar
-            progress_bar.start(10)
-            update_status_display("Extracting text...")
+            if not future.set_running_or_notify_cancel():
+                return
             try:
-                # Update original DocToAudiobook class to support progress callback
-                success, audio_files = self.converter.create_audiobook(
-                    input_file,
-                    output_dir=output_dir,
-                    max_chapters=max_chapters,
-                    use_ocr=use_ocr,
-                    chapter_detection_prompt=chapter_prompt if chapter_prompt else None
-                    # No progress callback needed for simplified version
-                )
-                
-                # Stop progress bar
-                progress_bar.stop()
-                self.progress_dialog.destroy()
-                
-                if success:
-                    # Show success message
-                    messagebox.showinfo(
-                        "Conversion Complete", 
-                        f"Successfully created audiobook with {len(audio_files)} files in {output_dir}"
-                    )
-                    
-                    # Ask if user wants to open output directory
-                    if messagebox.askyesno(
-                        "Open Folder", 
-                        "Would you like to open the output folder?"
-                    ):
-                        self.open_folder(output_dir)
-                    
-                    # Refresh recent files list
-                    self.load_recent_files()
-                else:
-                    messagebox.showerror(
-                        "Conversion Failed", 
-                        "Failed to convert document to audiobook. Check console for errors."
-                    )
+                result = None
+                events = self.converter.create_audiobook_iter(input_file, output_dir=output_dir)
+                try:
+                    # The converter yields as each chapter finishes; on cancel, closing
+                    # it cancels the TTS requests still in flight for later chapters
+                    for event in events:
+                        if cancel_event.is_set():
+                            break
+                        if "result" in event:
+                            result = event["result"]
+                        else:
+                            self.progress_queue.put(event)
+                finally:
+                    events.close()
+                future.set_result(result)
             except Exception as e:
-                progress_bar.stop()
-                self.progress_dialog.destroy()
-                messagebox.showerror(
-                    "Error", 
-                    f"An error occurred during conversion: {str(e)}"
-                )
-                print(f"Conversion Error Traceback:", file=sys.stderr)
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                logger.exception("Conversion failed")
+                future.set_exception(e)
         
-        # Start conversion thread
+        # Start conversion thread; daemon so closing the window doesn't wait for it
         threading.Thread(target=conversion_thread, daemon=True).start()
     
+    def _poll_progress(self):
+        """Apply queued progress and run queued callbacks on the Tk main thread."""
+        try:
+            latest = None
+            while True:
+                try:
+                    message = self.progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if not callable(message):
+                    # Only the most recent progress event of a burst is drawn
+                    latest = message
+                    continue
+                try:
+                    message()
+                except Exception:
+                    # A failing callback must not stop the messages queued behind it
+                    logger.exception("Error handling a queued GUI callback")
+            
+            if latest is not None:
+                self.progress_label.config(text=latest["stage"])
+                self.progress_var.set(latest["pct"])
+        finally:
+            # Keep polling no matter what, or the UI would sit at "in progress" forever
+            self.root.after(100, self._poll_progress)
+    
+    def cancel_conversion(self):
+        """Stop the running conversion and return the UI to its idle state."""
+        if self._conversion_future is None:
+            return
+        
+        # The worker stops at its next progress event; its Future is no longer
+        # current, so _finish_conversion drops whatever it settles with
+        self._cancel_event.set()
+        self._conversion_future = None
+        self._hide_progress()
+        self.convert_button.state(['!disabled'])
+    
+    def _hide_progress(self):
+        """Stop the progress bar and hide the progress widgets."""
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+        self.progress_label.pack_forget()
+        self.cancel_button.pack_forget()
+    
+    def _finish_conversion(self, future):
+        """Report the outcome of a settled conversion Future."""
+        # A cancelled conversion has already reset the UI; ignore its late result
+        if future is not self._conversion_future:
+            return
+        
+        self._conversion_future = None
+        self._hide_progress()
+        self.convert_button.state(['!disabled'])
+        
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror(
+                "Error", 
+                f"An error occurred during conversion: {str(error)}"
+            )
+            return
+        
+        result = future.result()
+        audio_files = result.get("output_files", [])
+        output_dir = self._conversion_output_dir
+        if result.get("status") != "failed":
+            # Report success and offer to open the output directory in one dialog
+            if self._show_completion_dialog(output_dir, len(audio_files)):
+                self.open_folder(output_dir)
+            
+            # Refresh recent files list
+            self.load_recent_files()
+        else:
+            messagebox.showerror(
+                "Conversion Failed", 
+                "Failed to convert document to audiobook. Check console for errors."
+            )
+    
+    def _show_completion_dialog(self, output_dir, n_files):
+        """Show the conversion result; return True if the user chose to open the output folder."""
+        self._completion_result = False
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Conversion Complete")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(
+            frame, 
+            text=f"Successfully created audiobook with {n_files} files in {output_dir}",
+            wraplength=360
+        ).pack(pady=(0, 10), anchor=tk.W)
+        
+        def choose(open_folder):
+            self._completion_result = open_folder
+            dialog.destroy()
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X)
+        
+        ttk.Button(
+            button_frame, 
+            text="Close", 
+            command=lambda: choose(False)
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        ttk.Button(
+            button_frame, 
+            text="Open Folder", 
+            command=lambda: choose(True)
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        dialog.grab_set()
+        self.root.wait_window(dialog)
+        return self._completion_result
+    
+    def open_folder(self, path):
+        """Open a folder in the platform file manager."""
+        try:
+            if sys.platform == "win32":
+                os.startfile(path)
+            else:
+                import subprocess
+                subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", path])
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open folder: {e}")
+    
     def update_status(self, message):
         """Update the status bar with a message."""
         self.status_bar.config(text=message)
@@ -3,6 +3,16 @@ import os
 import tempfile
 from pathlib import Path
 
+# RAM-backed locations tried, in order, for the session's temporary files
+_RAM_TMPDIRS = ("/dev/shm", f"/run/user/{os.getuid()}" if hasattr(os, "getuid") else None)
+
+def pytest_configure(config):
+    # Keep test databases and audio files off the physical disk where a tmpfs is available
+    for path in _RAM_TMPDIRS:
+        if path and os.path.isdir(path) and os.access(path, os.W_OK):
+            tempfile.tempdir = path
+            break
+
 @pytest.fixture(scope="session")
 def temp_dir():
     with tempfile.TemporaryDirectory() as tmp_dir:
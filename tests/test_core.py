@@ -2,131 +2,69 @@
 Test suite for core modules.
 """
 
+import functools
+import logging
 import os
 import json
+import sqlite3
 import tempfile
 import unittest
-import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from src.core.user_manager import UserManager
-from src.core.job_queue import JobQueue
-from src.core.cache_manager import TTSCache
+import numpy as np
+from pydub import AudioSegment
+
+from src.core.cache_manager import FileStorageBackend, TTSCache
 from src.core.document_processor import DocumentProcessor
 from src.core.audio_processor import AudioProcessor
+from src.core.audio_arena import AudioArena
 from src.core.chapter_manager import ChapterManager
 from src.core.bookmark_manager import BookmarkManager
+from src.core.utils.error import ErrorHandler
 
-class TestUserManager(unittest.TestCase):
-    """Tests for UserManager."""
-    
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "users.db")
-        self.user_manager = UserManager(db_path=self.db_path)
-        
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-        
-    def test_create_user(self):
-        success, message = self.user_manager.create_user(
-            "testuser", "test@example.com", "password123"
-        )
-        self.assertTrue(success)
-        self.assertEqual(message, "User created successfully")
-        
-    def test_duplicate_user(self):
-        self.user_manager.create_user("testuser", "test@example.com", "password123")
-        success, message = self.user_manager.create_user(
-            "testuser", "test2@example.com", "password123"
-        )
-        self.assertFalse(success)
-        self.assertEqual(message, "Username or email already exists")
-        
-    def test_authenticate_user(self):
-        self.user_manager.create_user("testuser", "test@example.com", "password123")
-        success, message, token_data = self.user_manager.authenticate_user(
-            "testuser", "password123"
-        )
-        self.assertTrue(success)
-        self.assertIsNotNone(token_data)
-        self.assertIn('token', token_data)
-        
-    def test_invalid_credentials(self):
-        success, message, token_data = self.user_manager.authenticate_user(
-            "testuser", "wrongpassword"
-        )
-        self.assertFalse(success)
-        self.assertIsNone(token_data)
-        
-class TestJobQueue(unittest.TestCase):
-    """Tests for JobQueue."""
+class DictStorageBackend(FileStorageBackend):
+    """In-memory stand-in for the audio files a TTSCache points at."""
     
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "jobs.db")
-        self.job_queue = JobQueue(db_path=self.db_path, max_workers=1)
-        
-    def tearDown(self):
-        self.job_queue.stop()
-        shutil.rmtree(self.temp_dir)
-        
-    def test_submit_job(self):
-        job_id = self.job_queue.submit_job(
-            "test_job",
-            {"data": "test"},
-            priority=1
-        )
-        self.assertIsNotNone(job_id)
-        
-    def test_get_job_status(self):
-        job_id = self.job_queue.submit_job(
-            "test_job",
-            {"data": "test"}
-        )
-        status = self.job_queue.get_job_status(job_id)
-        self.assertIsNotNone(status)
-        self.assertEqual(status['status'], 'pending')
+    def __init__(self):
+        self.files = {}
         
-    def test_job_processing(self):
-        def test_handler(data):
-            return {"result": "processed"}
-            
-        self.job_queue.register_handler("test_job", test_handler)
-        job_id = self.job_queue.submit_job(
-            "test_job",
-            {"data": "test"}
-        )
+    def exists(self, path):
+        return path in self.files
         
-        # Wait for processing
-        time.sleep(1)
-        
-        status = self.job_queue.get_job_status(job_id)
-        self.assertEqual(status['status'], 'completed')
-        self.assertEqual(status['result'], {"result": "processed"})
+    def remove(self, path):
+        del self.files[path]
         
 class TestTTSCache(unittest.TestCase):
     """Tests for TTSCache."""
     
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.cache_dir = os.path.join(self.temp_dir, "cache")
-        self.db_path = os.path.join(self.temp_dir, "cache.db")
-        self.cache = TTSCache(cache_dir=self.cache_dir, db_path=self.db_path)
+    # Shared-cache in-memory database; it lives as long as _keeper stays open
+    DB_URI = "file:tts_cache_test?mode=memory&cache=shared"
+    
+    @classmethod
+    def setUpClass(cls):
+        cls._td = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._td.cleanup)
+        cls.temp_dir = cls._td.name
+        cls.cache_dir = os.path.join(cls.temp_dir, "cache")
+        cls._keeper = sqlite3.connect(cls.DB_URI, uri=True)
+        cls.addClassCleanup(cls._keeper.close)
+        cls.storage = DictStorageBackend()
+        cls.cache = TTSCache(cache_dir=cls.cache_dir, db_path=cls.DB_URI,
+                             storage_backend=cls.storage)
         
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        with self._keeper:
+            self._keeper.execute("DELETE FROM cache")
+        self.storage.files.clear()
         
     def test_cache_audio(self):
         text = "Test text"
         voice_settings = {"voice": "test"}
         audio_file = os.path.join(self.temp_dir, "test.mp3")
         
-        # Create dummy audio file
-        with open(audio_file, 'w') as f:
-            f.write("dummy audio data")
-            
+        self.storage.files[audio_file] = b"dummy audio data"
+        
         success = self.cache.cache_audio(text, voice_settings, audio_file)
         self.assertTrue(success)
         
@@ -135,23 +73,57 @@ class TestTTSCache(unittest.TestCase):
         voice_settings = {"voice": "test"}
         audio_file = os.path.join(self.temp_dir, "test.mp3")
         
-        # Create dummy audio file
-        with open(audio_file, 'w') as f:
-            f.write("dummy audio data")
-            
+        self.storage.files[audio_file] = b"dummy audio data"
+        
         self.cache.cache_audio(text, voice_settings, audio_file)
         cached_file = self.cache.get_cached_audio(text, voice_settings)
         self.assertEqual(cached_file, audio_file)
         
+    def test_cache_audio_many(self):
+        audio_file = os.path.join(self.temp_dir, "test.mp3")
+        
+        self.storage.files[audio_file] = b"dummy audio data"
+        
+        entries = [(f"Text {i}", {"voice": "test"}, audio_file) for i in range(100)]
+        self.assertTrue(self.cache.cache_audio_many(entries))
+        
+        for text, voice_settings, _ in entries:
+            self.assertEqual(self.cache.get_cached_audio(text, voice_settings), audio_file)
+        
+    def test_clear(self):
+        audio_file = os.path.join(self.temp_dir, "test.mp3")
+        
+        self.storage.files[audio_file] = b"dummy audio data"
+        
+        self.cache.cache_audio_many([(f"Text {i}", {"voice": "test"}, audio_file) for i in range(3)])
+        self.cache.clear()
+        
+        self.assertIsNone(self.cache.get_cached_audio("Text 0", {"voice": "test"}))
+        self.assertEqual(self._keeper.execute("SELECT COUNT(*) FROM cache").fetchone()[0], 0)
+        
+    def test_on_disk_connection_settings(self):
+        db_path = os.path.join(self.temp_dir, "tts_cache.db")
+        cache = TTSCache(cache_dir=self.cache_dir, db_path=db_path, storage_backend=self.storage)
+        
+        conn = cache._connect()
+        self.addCleanup(conn.close)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+        
+@functools.lru_cache(maxsize=1)
+def _shared_processor():
+    # DocumentProcessor keeps no per-document state, so one instance serves every test
+    return DocumentProcessor()
+    
+@unittest.skipUnless(hasattr(DocumentProcessor, "extract_text"), "DocumentProcessor.extract_text is not available")
 class TestDocumentProcessor(unittest.TestCase):
     """Tests for DocumentProcessor."""
     
     def setUp(self):
-        self.processor = DocumentProcessor()
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+        self.processor = _shared_processor()
+        self._td = tempfile.TemporaryDirectory()
+        self.addCleanup(self._td.cleanup)
+        self.temp_dir = self._td.name
         
     def test_extract_text(self):
         # Create test document
@@ -167,22 +139,52 @@ class TestAudioProcessor(unittest.TestCase):
     
     def setUp(self):
         self.processor = AudioProcessor()
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
         
     def test_generate_speed_variants(self):
-        # Create test audio file
-        input_file = os.path.join(self.temp_dir, "test.mp3")
-        # Add test audio file creation code here
+        # 1024 samples of a 440 Hz sine, generated in memory
+        sample_rate = 22050
+        samples = np.sin(2 * np.pi * 440 * np.arange(1024) / sample_rate).astype(np.float32)
         
-        output_files = self.processor.generate_speed_variants(
-            input_file,
-            self.temp_dir,
+        variants = self.processor.generate_speed_variants_array(
+            samples,
+            sample_rate,
             speeds=[0.8, 1.0, 1.2]
         )
-        self.assertEqual(len(output_files), 3)
+        self.assertEqual(len(variants), 3)
+        # Faster playback means fewer samples, matching the pydub speed change in
+        # core.audio.processor (frame rate scaled by speed) and EnhancedTTS._adjust_speed
+        for speed in (0.8, 1.0, 1.2):
+            self.assertEqual(len(variants[speed]), round(len(samples) / speed))
+            
+    def test_combine_audio_files_empty(self):
+        self.assertFalse(self.processor.combine_audio_files([], "combined.mp3"))
+        
+class TestAudioArena(unittest.TestCase):
+    """Tests for AudioArena."""
+    
+    def test_append_segments(self):
+        segments = [AudioSegment.silent(duration=100 * (i + 1), frame_rate=24000) for i in range(3)]
+        arena = AudioArena(24000, segments[0].sample_width, 1, estimated_ms=100)
+        for segment in segments:
+            arena.append_segment(segment)
+            
+        combined = arena.to_audiosegment()
+        self.assertEqual(len(combined), 600)
+        self.assertEqual(combined.raw_data, sum(segments, AudioSegment.empty()).raw_data)
+        self.assertEqual(len(arena), 0)
+        
+    def test_widens_format_like_segment_addition(self):
+        low = AudioSegment.silent(duration=200, frame_rate=16000)
+        high = AudioSegment.silent(duration=300, frame_rate=44100).set_channels(2)
+        arena = AudioArena(low.frame_rate, low.sample_width, low.channels)
+        arena.append_segment(low)
+        arena.append_segment(high)
+        
+        combined = arena.to_audiosegment()
+        expected = low + high
+        self.assertEqual((combined.frame_rate, combined.sample_width, combined.channels),
+                         (expected.frame_rate, expected.sample_width, expected.channels))
+        self.assertEqual(len(combined), len(expected))
         
 class TestChapterManager(unittest.TestCase):
     """Tests for ChapterManager."""
@@ -206,12 +208,12 @@ class TestChapterManager(unittest.TestCase):
 class TestBookmarkManager(unittest.TestCase):
     """Tests for BookmarkManager."""
     
-    def setUp(self):
-        self.manager = BookmarkManager()
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = BookmarkManager()
+        cls._td = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._td.cleanup)
+        cls.temp_dir = cls._td.name
         
     def test_create_bookmark_data(self):
         bookmark_data = self.manager.create_bookmark_data(
@@ -222,5 +224,49 @@ class TestBookmarkManager(unittest.TestCase):
         self.assertIsNotNone(bookmark_data)
         self.assertEqual(bookmark_data['audiobook_id'], "test_book")
         
+    def test_create_bookmark_data_many_chapters(self):
+        chapter_info = [{"title": f"Chapter {i}", "content": f"Content {i}"} for i in range(50)]
+        chapter_times = [{"start": i * 100, "end": (i + 1) * 100} for i in range(50)]
+        bookmark_data = self.manager.create_bookmark_data("test_book", chapter_info, chapter_times)
+        self.assertEqual(bookmark_data['chapters'], [
+            {'index': i, 'title': f"Chapter {i}", 'start_time': i * 100, 'duration': 100}
+            for i in range(50)
+        ])
+        self.assertEqual(bookmark_data['play_history'], [])
+        
+class TestErrorHandler(unittest.TestCase):
+    """Tests for ErrorHandler."""
+    
+    def setUp(self):
+        self.logger = logging.getLogger("test_error_handler")
+        self.addCleanup(setattr, self.logger, "disabled", False)
+        self.handler = ErrorHandler(self.logger)
+        
+    def test_logging_enabled_after_decoration(self):
+        # Decorate while logging is off, as happens at import time before logging is configured
+        self.logger.disabled = True
+        
+        @self.handler.handle_errors({"step": "test"})
+        def failing():
+            raise ValueError("boom")
+            
+        wrapped = self.handler.wrap_method(failing)
+        self.logger.disabled = False
+        
+        for func in (failing, wrapped):
+            with self.assertLogs(self.logger, level="ERROR") as logs, self.assertRaises(ValueError):
+                func()
+            self.assertIn("boom", logs.output[0])
+            
+    def test_disabled_logging_still_raises(self):
+        self.logger.disabled = True
+        
+        @self.handler.handle_errors()
+        def failing():
+            raise ValueError("boom")
+            
+        with self.assertRaises(ValueError):
+            failing()
+        
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
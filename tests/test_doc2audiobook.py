@@ -1,57 +1,90 @@
+import copy
+
 import pytest
-import os
-from src.doc2audiobook import DocToAudiobook
-from src.config_manager import ConfigManager
+from pydub import AudioSegment
+from src.core.doc2audiobook import DocToAudiobook
+from src.core.config_manager import ConfigManager
+from src.core.models.tts import TTSSettings, VoiceSettings
 
-@pytest.fixture
-def config_manager():
-    return ConfigManager()
+@pytest.fixture(scope="session")
+def config_manager(tmp_path_factory):
+    return ConfigManager(config_file=str(tmp_path_factory.mktemp("config") / "config.json"))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def doc2audiobook(config_manager):
     return DocToAudiobook(config_manager)
 
+@pytest.fixture(autouse=True)
+def _reset(doc2audiobook):
+    # The converter is shared across tests; the only state they change is its saved settings
+    saved = copy.deepcopy(doc2audiobook.config_manager.config)
+    yield
+    doc2audiobook.config_manager.config = saved
+    doc2audiobook.config_manager.save_config()
+
 def test_chunk_splitting(doc2audiobook):
     text = "This is a test. This is another sentence. And one more."
-    chunks = doc2audiobook.split_into_chunks(text, max_chars=20)
+    chunks = doc2audiobook.tts_engine._split_text_to_chunks(text, 20)
     assert len(chunks) > 1
     assert all(len(chunk) <= 20 for chunk in chunks)
 
-def test_semantic_analysis(doc2audiobook):
-    text = "The quick brown fox jumps over the lazy dog. This is an important sentence."
-    analysis = doc2audiobook.analyze_text_semantics(text)
-    assert 'important_sentences' in analysis
-    assert len(analysis['important_sentences']) > 0
-
-def test_ssml_generation(doc2audiobook):
+def test_style_emphasis(doc2audiobook):
     text = "This is a heading. This is important content."
-    analysis = doc2audiobook.analyze_text_semantics(text)
-    ssml = doc2audiobook.generate_ssml_with_emphasis(text, analysis)
-    assert "<speak>" in ssml
-    assert "<emphasis" in ssml or "<prosody" in ssml
-
-def test_cache_handling(doc2audiobook):
-    text = "Test text for caching"
-    settings = {"voice": "test-voice", "speed": 1.0}
-    
-    # Test caching
-    cache_file = doc2audiobook.cache.get_cached_audio(text, settings)
-    assert cache_file is None
-    
-    # Test saving to cache
-    test_file = "test.mp3"
-    doc2audiobook.cache.cache_audio(text, settings, test_file)
-    cache_file = doc2audiobook.cache.get_cached_audio(text, settings)
-    assert cache_file == test_file
+    enhanced_text = doc2audiobook.tts_engine._enhance_text_for_emotion(text, "excited", "excited")
+    assert "[Excitedly]" in enhanced_text
+    assert "*" in enhanced_text
+
+def test_update_voice_settings(doc2audiobook):
+    doc2audiobook.update_voice_settings(VoiceSettings(voice_id="nova", speed=1.25))
+    assert doc2audiobook.voice_settings["voice"] == "nova"
+    assert doc2audiobook.voice_settings["speed"] == 1.25
+
+def test_loudness_normalization_setting(doc2audiobook):
+    settings = TTSSettings.from_dict(doc2audiobook.voice_settings)
+    assert (settings.loudness_normalization, settings.target_loudness) == (False, -16.0)
+
+    doc2audiobook.update_voice_settings(VoiceSettings(loudness_normalization=True, target_loudness=-18.0))
+    settings = TTSSettings.from_dict(doc2audiobook.voice_settings)
+    assert (settings.loudness_normalization, settings.target_loudness) == (True, -18.0)
+
+def test_voice_settings_reset_between_tests(doc2audiobook):
+    assert doc2audiobook.voice_settings["voice"] == "alloy"
 
 def test_bookmark_creation(doc2audiobook):
     chapter_info = [{"title": "Chapter 1", "content": "Content 1"}]
     chapter_times = [{"start": 0, "end": 100}]
-    bookmark_data = doc2audiobook.create_bookmark_data(
+    bookmark_data = doc2audiobook.bookmark_manager.create_bookmark_data(
         "test-id",
         chapter_info,
         chapter_times
     )
     assert bookmark_data['audiobook_id'] == "test-id"
     assert len(bookmark_data['chapters']) == 1
-    assert 'play_history' in bookmark_data 
\ No newline at end of file
+    assert 'play_history' in bookmark_data
+
+def test_create_audiobook_iter_reports_each_chapter(doc2audiobook, monkeypatch, tmp_path):
+    chapters = [("One", "First chapter."), ("Empty", "  "), ("Three", "Third chapter.")]
+    requested = []
+
+    def iter_audio_batch(texts, settings):
+        requested.extend(texts)
+        # The later chapter finishes first
+        for index in reversed(range(len(texts))):
+            yield index, AudioSegment.silent(duration=100 * (index + 1))
+
+    monkeypatch.setattr(doc2audiobook.document_processor, "process_document", lambda path: ("text", {}))
+    monkeypatch.setattr(doc2audiobook.chapter_manager, "detect_chapters", lambda text, max_chapters: chapters)
+    monkeypatch.setattr(doc2audiobook.tts_engine, "iter_audio_batch", iter_audio_batch)
+    monkeypatch.setattr(doc2audiobook.audio_processor, "combine_audio_files", lambda paths, output: False)
+    monkeypatch.setattr(AudioSegment, "export", lambda self, path, format: open(path, "wb").write(b"mp3"))
+
+    events = list(doc2audiobook.create_audiobook_iter("book.txt", str(tmp_path)))
+
+    assert requested == ["First chapter.", "Third chapter."]
+    assert [(e["stage"], e["pct"]) for e in events if e["stage"].startswith("Converted")] == [
+        ("Converted chapter 3 of 3: Three", 50.0),
+        ("Converted chapter 1 of 3: One", 90.0),
+    ]
+    result = events[-1]["result"]
+    assert result["status"] == "partial"
+    assert [f["name"] for f in result["output_files"]] == ["chapter_001.mp3", "chapter_003.mp3"]
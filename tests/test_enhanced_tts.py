@@ -0,0 +1,319 @@
+import asyncio
+import importlib
+import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy import signal
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# The app, GUI and CLI import the package as "core"; diagnose.py and the tests use "src.core"
+IMPORT_NAMES = ["src.core.tts.enhanced", "core.tts.enhanced"]
+
+@pytest.fixture(params=IMPORT_NAMES)
+def enhanced(request, monkeypatch):
+    monkeypatch.syspath_prepend(str(SRC_DIR))
+    return importlib.import_module(request.param)
+
+@pytest.fixture
+def fake_api(enhanced, monkeypatch):
+    """Replace the AsyncOpenAI client with one that answers each chunk with len(input) PCM frames."""
+    helper = importlib.import_module(enhanced.__name__.rsplit(".", 2)[0] + ".utils.openai_helper")
+    api = SimpleNamespace(clients=[], inputs=[], before_reply=None, in_flight=0, max_in_flight=0)
+
+    class FakeSpeech:
+        async def create(self, input, **kwargs):
+            api.inputs.append(input)
+            api.in_flight += 1
+            api.max_in_flight = max(api.max_in_flight, api.in_flight)
+            try:
+                await asyncio.sleep(0)
+                if api.before_reply:
+                    await api.before_reply(input)
+            finally:
+                api.in_flight -= 1
+            return SimpleNamespace(content=np.full(len(input), 1000, dtype=np.int16).tobytes())
+
+    class FakeAsyncClient:
+        def __init__(self):
+            self.closed = False
+            self.audio = SimpleNamespace(speech=FakeSpeech())
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            self.closed = True
+
+    def get_client(api_key):
+        api.clients.append(FakeAsyncClient())
+        return api.clients[-1]
+
+    monkeypatch.setattr(helper, "get_async_openai_client", get_client)
+    monkeypatch.setattr(enhanced.EnhancedTTS, "_get_api_key", lambda self: "sk-test")
+    return api
+
+@pytest.fixture
+def sine():
+    # One second of a quiet 440 Hz tone at the TTS PCM rate
+    t = np.arange(24000) / 24000
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)[:, None]
+
+def test_normalization_under_both_import_names(enhanced, sine):
+    tts = enhanced.EnhancedTTS()
+    out = tts._apply_dynamics(sine, 24000, compression=False, normalize=True)
+    assert np.abs(out).max() == pytest.approx(10 ** (-enhanced.NORMALIZE_HEADROOM_DB / 20), rel=1e-3)
+
+def test_style_effects_under_both_import_names(enhanced, sine):
+    tts = enhanced.EnhancedTTS()
+    out = tts._apply_style_samples(sine, 24000, "sad")
+    # "sad" slows playback by 0.95, so the audio gets longer
+    assert out.shape[0] == int(sine.shape[0] / 0.95)
+    assert not np.allclose(out[:sine.shape[0]], sine)
+
+def test_kernel_failure_falls_back_to_numpy(enhanced, sine, monkeypatch):
+    def broken(*args):
+        raise RuntimeError("kernel unavailable")
+
+    monkeypatch.setattr(enhanced._dsp_kernels, "HAVE_NUMBA", True)
+    monkeypatch.setattr(enhanced._dsp_kernels, "dynamics", broken)
+    monkeypatch.setattr(enhanced._dsp_kernels, "sosfilt", broken)
+    tts = enhanced.EnhancedTTS()
+
+    out = tts._apply_dynamics(sine, 24000, compression=False, normalize=True)
+    assert np.abs(out).max() == pytest.approx(10 ** (-enhanced.NORMALIZE_HEADROOM_DB / 20), rel=1e-3)
+
+    sos = enhanced._STYLE_COEFFS[24000]["sad"][1]
+    expected = signal.sosfilt(sos, sine, axis=0)
+    np.testing.assert_allclose(tts._apply_sos(sine, sos), expected, atol=1e-5)
+
+def test_generate_audio_closes_client(enhanced, fake_api):
+    settings = enhanced.TTSSettings(enhance=False)
+    audio = enhanced.EnhancedTTS().generate_audio("Hello there. " * 500, settings)
+
+    # One PCM frame per input character, across every chunk
+    assert audio.frame_count() == sum(len(text) for text in fake_api.inputs)
+    assert len(fake_api.inputs) > 1
+    assert [client.closed for client in fake_api.clients] == [True]
+
+def test_agenerate_audio_matches_generate_audio(enhanced, fake_api):
+    tts = enhanced.EnhancedTTS()
+    settings = enhanced.TTSSettings(enhance=False)
+    expected = tts.generate_audio("Some text to speak.", settings)
+
+    audio = asyncio.run(tts.agenerate_audio("Some text to speak.", settings))
+    assert audio.raw_data == expected.raw_data
+    assert all(client.closed for client in fake_api.clients)
+
+def test_generate_audio_inside_event_loop_raises(enhanced, fake_api):
+    async def call_sync_api():
+        return enhanced.EnhancedTTS().generate_audio("Hello.", enhanced.TTSSettings())
+
+    with pytest.raises(RuntimeError, match="agenerate_audio"):
+        asyncio.run(call_sync_api())
+    assert fake_api.clients == []
+
+def test_generate_audio_batch_keeps_input_order(enhanced, fake_api):
+    texts = ["a" * 10, "b" * 20, "c" * 30]
+
+    async def later_texts_reply_first(text):
+        await asyncio.sleep(0.1 * (3 - len(text) // 10))
+
+    fake_api.before_reply = later_texts_reply_first
+    tts = enhanced.EnhancedTTS()
+    settings = enhanced.TTSSettings(enhance=False)
+
+    completed = [index for index, _ in tts.iter_audio_batch(texts, settings)]
+    assert completed == [2, 1, 0]
+
+    audio = tts.generate_audio_batch(texts, settings)
+    assert [segment.frame_count() for segment in audio] == [10, 20, 30]
+
+def test_generate_audio_batch_overlaps_requests_with_enhancement(enhanced, fake_api, monkeypatch):
+    rendered = threading.Event()
+    render_pcm = enhanced.EnhancedTTS._render_pcm
+
+    def record_render(self, pcm_buffer, settings):
+        rendered.set()
+        return render_pcm(self, pcm_buffer, settings)
+
+    async def second_waits_for_first_render(text):
+        # Only answers once the first text has been enhanced, so this deadlocks if enhancement waits for every request
+        deadline = time.monotonic() + 5
+        while text.startswith("Second") and not rendered.is_set():
+            assert time.monotonic() < deadline, "enhancement did not overlap the pending request"
+            await asyncio.sleep(0.005)
+
+    monkeypatch.setattr(enhanced.EnhancedTTS, "_render_pcm", record_render)
+    fake_api.before_reply = second_waits_for_first_render
+    audio = enhanced.EnhancedTTS().generate_audio_batch(["First text.", "Second text."], enhanced.TTSSettings())
+    assert [segment.frame_count() for segment in audio] == [11, 12]
+    assert [client.closed for client in fake_api.clients] == [True]
+
+def test_generate_audio_batch_limits_requests_in_flight(enhanced, fake_api):
+    async def slow_reply(text):
+        await asyncio.sleep(0.01)
+
+    fake_api.before_reply = slow_reply
+    texts = [f"Text number {i}." for i in range(6)]
+    enhanced.EnhancedTTS().generate_audio_batch(texts, enhanced.TTSSettings(enhance=False), max_in_flight=2)
+    assert fake_api.max_in_flight == 2
+
+def test_generate_audio_batch_reports_failed_text(enhanced, fake_api):
+    tts = enhanced.EnhancedTTS()
+    settings = enhanced.TTSSettings(enhance=False)
+    texts = ["First text.", "   ", "Third text."]
+
+    results = dict(tts.iter_audio_batch(texts, settings))
+    assert isinstance(results[1], ValueError)
+    assert results[0].frame_count() == 11 and results[2].frame_count() == 11
+
+    with pytest.raises(ValueError, match="text 2"):
+        tts.generate_audio_batch(texts, settings)
+
+def test_closing_batch_iterator_cancels_pending_requests(enhanced, fake_api):
+    async def second_never_replies(text):
+        if text.startswith("Second"):
+            await asyncio.sleep(60)
+
+    fake_api.before_reply = second_never_replies
+    batch = enhanced.EnhancedTTS().iter_audio_batch(["First text.", "Second text."], enhanced.TTSSettings(enhance=False))
+    assert next(batch)[0] == 0
+
+    started = time.monotonic()
+    batch.close()
+    assert time.monotonic() - started < 5
+    assert [client.closed for client in fake_api.clients] == [True]
+
+@pytest.fixture
+def tts():
+    return importlib.import_module("src.core.tts.enhanced").EnhancedTTS()
+
+CHUNK_TEXTS = [
+    "Intro.\n\n" + "word " * 30,
+    "First sentence is here. " * 12,
+    "Clause one, clause two; clause three: " * 8 + "end.",
+    "Opening paragraph.\n\nA second paragraph that runs on. " * 6,
+    "tiny " + "x" * 250 + " tail",
+]
+
+@pytest.mark.parametrize("text", CHUNK_TEXTS)
+def test_split_text_keeps_all_content_within_limit(tts, text):
+    chunks = tts._split_text_to_chunks(text, 100)
+
+    assert all(0 < len(chunk) <= 100 for chunk in chunks)
+    # Chunks appear in order in the text and only separators are dropped between them
+    position = 0
+    for chunk in chunks:
+        found = text.index(chunk, position)
+        assert not text[position:found].strip()
+        position = found + len(chunk)
+    assert not text[position:].strip()
+
+def test_split_text_hard_cuts_oversized_word(tts):
+    assert tts._split_text_to_chunks("x" * 250, 100) == ["x" * 100, "x" * 100, "x" * 50]
+
+def test_split_text_prefers_paragraph_break(tts):
+    first = "One sentence here. Another one follows. And a third, longer one."
+    # Clause and word breaks later in the window do not outrank the paragraph break
+    second = "The next paragraph has no full stop, only a comma and plenty of words"
+    assert tts._split_text_to_chunks(f"{first}\n\n{second}", 100) == [first, second]
+
+def test_split_text_prefers_sentence_over_word_break(tts):
+    text = "Alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu. " + "nu xi omicron pi " * 6
+    chunks = tts._split_text_to_chunks(text, 100)
+    assert chunks[0].endswith("lambda mu.")
+
+def test_split_text_avoids_short_leading_chunk(tts):
+    # A paragraph break just after the chunk start would cost a request for a 6-char chunk
+    chunks = tts._split_text_to_chunks("Intro.\n\n" + "word " * 30, 100)
+    assert len(chunks) == 2
+    assert chunks[0].startswith("Intro.")
+
+EMPHASIS_TEXT = """
+    The committee met early on Tuesday. Nobody expected the announcement.
+
+    Afterwards, the members walked slowly home through the quiet streets,
+    talking about what the decision would mean for everyone in the town.
+"""
+
+def _baseline_emphasis(text, marker, every, min_words=0, exclaim=False):
+    # The split/join implementation the regex version replaced
+    enhanced_text = f"{marker} {text.strip()}"
+    if exclaim:
+        enhanced_text = enhanced_text.replace(".", "!")
+    words = enhanced_text.split()
+    if len(words) <= min_words:
+        return enhanced_text
+    for i in range(len(words)):
+        if i % every == 0 and len(words[i]) > 3:
+            words[i] = f"*{words[i]}*"
+    return " ".join(words)
+
+@pytest.mark.parametrize("style, emotion, marker, every, min_words, exclaim", [
+    ("cheerful", "happy", "[Cheerfully]", 10, 10, False),
+    ("excited", "excited", "[Excitedly]", 6, 0, True),
+])
+def test_emphasis_matches_baseline_words_and_keeps_whitespace(tts, style, emotion, marker, every, min_words, exclaim):
+    result = tts._enhance_text_for_emotion(EMPHASIS_TEXT, style, emotion)
+    baseline = _baseline_emphasis(EMPHASIS_TEXT, marker, every, min_words, exclaim)
+
+    # Same words emphasised as before...
+    assert result.split() == baseline.split()
+    # ...but the paragraph break and line breaks survive instead of collapsing to single spaces
+    assert re.sub(r"\S+", "w", result) == re.sub(r"\S+", "w", f"{marker} {EMPHASIS_TEXT.strip()}")
+    assert "\n\n" in result
+
+def test_loudness_normalization_reaches_target(tts):
+    pyln = pytest.importorskip("pyloudnorm")
+    enhanced = importlib.import_module("src.core.tts.enhanced")
+
+    # Five seconds of quiet noise, well below the target loudness
+    samples = (0.02 * np.random.default_rng(0).standard_normal((5 * 24000, 1))).astype(np.float32)
+    settings = enhanced.TTSSettings(loudness_normalization=True, target_loudness=-18.0)
+
+    out = tts._enhance_samples(samples, 24000, settings)
+    assert out.dtype == np.float32
+    assert pyln.Meter(24000).integrated_loudness(out) == pytest.approx(-18.0, abs=0.1)
+
+@pytest.fixture(params=["numba", "python"])
+def compressor_path(request, enhanced, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(enhanced._dsp_kernels, "HAVE_NUMBA", False)
+    elif not enhanced._dsp_kernels.HAVE_NUMBA:
+        pytest.skip("numba is not installed")
+    return request.param
+
+def test_compression_attack_and_release_on_step(enhanced, compressor_path):
+    from pydub import AudioSegment
+    from pydub.effects import compress_dynamic_range
+
+    ms = 24
+    # 50 ms of silence, 200 ms at -6 dBFS, then 300 ms at -26 dBFS (below the threshold)
+    step = np.concatenate([np.zeros(50 * ms), np.full(200 * ms, 0.5), np.full(300 * ms, 0.05)])
+    out = enhanced.EnhancedTTS()._apply_dynamics(
+        step.astype(np.float32)[:, None], 24000, compression=True, normalize=False
+    )[:, 0]
+
+    def reduction_db(n):
+        return 20 * np.log10(step[n] / out[n])
+
+    steady_db = (1 - 1 / enhanced.COMPRESSION_RATIO) * (20 * np.log10(0.5) - enhanced.COMPRESSION_THRESHOLD_DB)
+
+    # Attack: most of the gain reduction is in place three attack time constants after the onset
+    assert reduction_db(50 * ms + 15 * ms) > 0.9 * steady_db
+    assert reduction_db(250 * ms - 1) == pytest.approx(steady_db, abs=0.01)
+
+    # pydub's compressor (attack=5, release=50) settles on the same gain reduction
+    segment = AudioSegment((step * 32767).astype(np.int16).tobytes(), frame_rate=24000, sample_width=2, channels=1)
+    old = np.frombuffer(compress_dynamic_range(segment, attack=5.0, release=50.0).raw_data, dtype=np.int16) / 32767
+    assert 20 * np.log10(out[80 * ms] / old[80 * ms]) == pytest.approx(0.0, abs=0.1)
+
+    # Release: gain comes back on the slower release time after the level drops
+    assert reduction_db(250 * ms + 5 * ms) > 0.5
+    assert reduction_db(550 * ms - 1) == pytest.approx(0.0, abs=0.01)